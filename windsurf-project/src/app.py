@@ -42,6 +42,10 @@ if not os.path.exists(BASE_DIR):
 app.config['BASE_DIR'] = BASE_DIR
 SETTINGS_FILE = os.path.join(parent_dir, 'settings.json')
 ALLOWED_PROVIDERS = ["DeepL", "Azure", "Gemini"]
+# Tuples so hot loops can test extensions with one str.endswith call
+# instead of splitext + set lookup per file.
+VIDEO_EXTS = ('.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.mpeg', '.mpg')
+SYNC_VIDEO_EXTS = VIDEO_EXTS + ('.ts', '.m2ts')
 OBSERVER = None
 OBSERVED_PATH = None
 
@@ -187,15 +191,15 @@ def list_files():
     
     items = []
     try:
-        for item in os.listdir(full_path):
-            item_path = os.path.join(full_path, item)
-            is_dir = os.path.isdir(item_path)
-            items.append({
-                'name': item,
-                'is_dir': is_dir,
-                'path': os.path.join(path, item).replace('\\', '/'),
-                'size': os.path.getsize(item_path) if not is_dir else None
-            })
+        with os.scandir(full_path) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir()
+                items.append({
+                    'name': entry.name,
+                    'is_dir': is_dir,
+                    'path': os.path.join(path, entry.name).replace('\\', '/'),
+                    'size': entry.stat().st_size if not is_dir else None
+                })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     
@@ -222,14 +226,14 @@ def folder_sizes():
 
     items = []
     try:
-        for item in os.listdir(full_path):
-            item_path = os.path.join(full_path, item)
-            if not os.path.isdir(item_path):
-                continue
-            items.append({
-                'path': os.path.join(path, item).replace('\\', '/'),
-                'size': _calculate_directory_size(item_path)
-            })
+        with os.scandir(full_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                items.append({
+                    'path': os.path.join(path, entry.name).replace('\\', '/'),
+                    'size': _calculate_directory_size(entry.path)
+                })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1694,11 +1698,6 @@ def sync_subtitles():
             raise ValueError('Path escapes the configured base directory')
         return os.path.relpath(abs_path, base_abs).replace('\\', '/')
 
-    video_exts = {
-        '.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v',
-        '.mpeg', '.mpg', '.ts', '.m2ts'
-    }
-
     try:
         safe_video = _safe_rel_path(video_path)
         safe_subtitle = _safe_rel_path(subtitle_path)
@@ -1709,7 +1708,7 @@ def sync_subtitles():
             return jsonify({'error': 'Selected video file was not found'}), 400
         if not os.path.isfile(subtitle_abs):
             return jsonify({'error': 'Selected subtitle file was not found'}), 400
-        if os.path.splitext(safe_video)[1].lower() not in video_exts:
+        if not safe_video.lower().endswith(SYNC_VIDEO_EXTS):
             return jsonify({'error': 'Sync requires a supported video file'}), 400
         if not safe_subtitle.lower().endswith('.srt'):
             return jsonify({'error': 'Sync requires an SRT subtitle file'}), 400
@@ -2340,7 +2339,6 @@ def extract_subtitles():
     # Get extraction source language from settings
     extraction_source_language = settings.get('extraction_source_language', 'eng')
     
-    video_exts = {'.mkv','.mp4','.avi','.mov','.wmv','.flv','.webm','.m4v','.mpeg','.mpg'}
     added_jobs = []
     errors = []
     
@@ -2348,8 +2346,7 @@ def extract_subtitles():
         try:
             safe_rel = rel.lstrip('/').replace('..','')
             video_path = os.path.join(base_dir, safe_rel)
-            ext = os.path.splitext(video_path)[1].lower()
-            if ext not in video_exts or not os.path.isfile(video_path):
+            if not video_path.lower().endswith(VIDEO_EXTS) or not os.path.isfile(video_path):
                 continue  # Skip silently
             
             # Add job to queue
@@ -1,10 +1,42 @@
 import re
 from pathlib import Path
 
+# Compiled once at import; clean_ass_line runs per dialogue line, so the
+# per-call re-cache lookup adds up on large scripts.
+_DRAWING_RE = re.compile(r'\{[^}]*\\p[1-9][^}]*\}.*')
+
+
+def _strip_tags(s: str) -> str:
+    """Drop {...} override blocks without invoking the regex engine.
+
+    str.find compiles down to a memchr scan, which beats spinning up a
+    regex match per line when most lines carry no tags at all. Empty
+    '{}' pairs and unmatched braces are left in place, matching the old
+    r'\\{[^}]+\\}' behaviour.
+    """
+    j = s.find('{')
+    if j < 0:
+        return s
+    out = []
+    i = 0
+    while j >= 0:
+        k = s.find('}', j + 1)
+        if k < 0:
+            break
+        if k == j + 1:
+            j = s.find('{', k + 1)
+            continue
+        out.append(s[i:j])
+        i = k + 1
+        j = s.find('{', i)
+    out.append(s[i:])
+    return ''.join(out)
+
 
 def clean_ass_line(text: str) -> str:
-    text = re.sub(r'\{[^}]*\\p[1-9][^}]*\}.*', '', text)
-    text = re.sub(r'\{[^}]+\}', '', text)
+    if '{' in text:
+        text = _DRAWING_RE.sub('', text)
+        text = _strip_tags(text)
     return text.strip()
 
 
@@ -16,6 +48,25 @@ def _parse_format_fields(format_line: str):
     return fields
 
 
+def _compile_dialogue_re(style_idx, text_idx):
+    """Build a one-scan matcher for event lines from the Format header.
+
+    Group 1 captures everything up to and including the comma before the
+    Text field, so rebuilt lines keep every other field byte-for-byte.
+    When the header declares a Style column before Text it is exposed as
+    a nested 'style' group; 'text' is the remainder of the line. One
+    C-level match replaces the startswith/find/split passes the cleaner
+    used to run per dialogue line.
+    """
+    if style_idx is not None and style_idx < text_idx:
+        fields = (r'(?:[^,]*,){%d}(?P<style>[^,]*)(?:,[^,]*){%d},'
+                  % (style_idx, text_idx - style_idx - 1))
+    else:
+        fields = r'(?:[^,]*,){%d}' % text_idx
+    return re.compile(r'([ \t]*(?:Dialogue|Comment):[ \t]*' + fields + r')(?P<text>.*)$',
+                      re.IGNORECASE)
+
+
 def _has_default_style(lines) -> bool:
     in_styles = False
     for line in lines:
@@ -49,9 +100,8 @@ def clean_ass_file(input_path: Path, output_path: Path) -> None:
         raise ValueError('Missing Default style in [V4+ Styles]')
 
     in_events = False
-    format_fields = None
-    text_idx = None
-    style_idx = None
+    dialogue_re = None
+    has_style = False
 
     out_lines = []
     for line in lines:
@@ -79,43 +129,34 @@ def clean_ass_file(input_path: Path, output_path: Path) -> None:
 
         if in_events and stripped.lower().startswith('format:'):
             format_fields = _parse_format_fields(stripped)
+            dialogue_re = None
             if format_fields:
+                lowered = [f.lower() for f in format_fields]
                 try:
-                    text_idx = [f.lower() for f in format_fields].index('text')
+                    text_idx = lowered.index('text')
                 except ValueError:
                     text_idx = None
                 try:
-                    style_idx = [f.lower() for f in format_fields].index('style')
+                    style_idx = lowered.index('style')
                 except ValueError:
                     style_idx = None
+                if text_idx is not None:
+                    dialogue_re = _compile_dialogue_re(style_idx, text_idx)
+                    has_style = 'style' in dialogue_re.groupindex
             out_lines.append(line)
             continue
 
-        if in_events and text_idx is not None and (
-            stripped.lower().startswith('dialogue:') or stripped.lower().startswith('comment:')
-        ):
-            prefix_end = core.lower().find(':')
-            prefix = core[: prefix_end + 1]
-            payload = core[prefix_end + 1 :]
-            leading_ws = payload[: len(payload) - len(payload.lstrip())]
-            payload_stripped = payload.lstrip()
-
-            parts = payload_stripped.split(',', len(format_fields) - 1)
-            if len(parts) >= len(format_fields):
-                if style_idx is not None:
-                    style_value = parts[style_idx].strip()
-                    if style_value != 'Default':
-                        continue
-
-                original_text = parts[text_idx]
-                cleaned_text = clean_ass_line(original_text)
-                if not cleaned_text:
+        if in_events and dialogue_re is not None:
+            match = dialogue_re.match(core)
+            if match:
+                if has_style and match.group('style').strip() != 'Default':
                     continue
-                parts[text_idx] = cleaned_text
 
-                rebuilt_payload = ','.join(parts)
+                cleaned_text = clean_ass_line(match.group('text'))
+                if not cleaned_text:
+                    continue
 
-                out_lines.append(prefix + leading_ws + rebuilt_payload + line_ending)
+                out_lines.append(match.group(1) + cleaned_text + line_ending)
                 continue
 
         out_lines.append(line)
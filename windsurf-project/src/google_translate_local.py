@@ -10,6 +10,7 @@ from retry.api import retry
 from deep_translator import GoogleTranslator
 from deep_translator.exceptions import TooManyRequests, RequestError, TranslationNotFound
 from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import os
 
 logger = logging.getLogger(__name__)
@@ -116,7 +117,7 @@ class LocalGoogleTranslator:
                         logger.error(f"Error in translation task: {e}")
             
             # Sort translated lines by ID to maintain order
-            translated_lines.sort(key=lambda x: x['id'])
+            translated_lines.sort(key=itemgetter('id'))
             
             # Update subtitle lines with translations
             for item in translated_lines:
@@ -3,16 +3,46 @@ Job Queue System for Subtitle Processing
 Manages asynchronous job processing with configurable parallelism and error handling
 """
 
+import re
 import sqlite3
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable
 import subprocess
 import os
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# guessit and babelfish are only needed for publish jobs; importing them here
+# (instead of inside the job) avoids the expensive first import on the job
+# thread, but startup must still work without them.
+try:
+    from guessit import guessit
+except ImportError:
+    guessit = None
+try:
+    from babelfish import Language
+except ImportError:
+    Language = None
 from subtitle_sync import HeavySyncConfig, SubtitleSyncError, SyncMatchingConfig, WhisperTranscriptionConfig, sync_subtitle_file
+from translation_providers import translate_srt_file, start_vpn, stop_vpn
+
+# Settings written from the queue are machine-read (the UI re-pretty-prints
+# on its own saves), so serialize compactly instead of indenting.
+try:
+    import orjson
+
+    def _dump_settings(settings: Dict) -> bytes:
+        return orjson.dumps(settings)
+except ImportError:
+    def _dump_settings(settings: Dict) -> bytes:
+        return json.dumps(settings, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
 # Job status constants
 STATUS_PENDING = 'pending'
@@ -29,6 +59,53 @@ JOB_TYPE_SEARCH_SUBTITLES = 'search_subtitles'
 JOB_TYPE_SYNC_SUBTITLES = 'sync_subtitles'
 JOB_TYPE_PUBLISH_SUBTITLES = 'publish_subtitles'
 
+# Fixed SQL for the common status-update shapes. Constant query strings let
+# SQLite serve them from the per-connection prepared-statement cache instead
+# of re-parsing a freshly built string on every write.
+_SQL_MARK_RUNNING = 'UPDATE jobs SET status = ?, started_at = ? WHERE id = ?'
+_SQL_MARK_DONE_RESULT = 'UPDATE jobs SET status = ?, completed_at = ?, result = ? WHERE id = ?'
+_SQL_MARK_DONE_ERROR = 'UPDATE jobs SET status = ?, completed_at = ?, error_message = ? WHERE id = ?'
+
+# Precompiled patterns for the filename inference in _publish_to_subdl.
+_LANG_SUFFIX_RE = re.compile(r'\.([a-zA-Z]{2,3})(?:\.[0-9]+)?$')
+_HI_RE = re.compile(r'\b(?:hi|sdh)\b')
+_QUALITY_RE = re.compile(r'bluray|bdrip|bdremux|dvdrip|dvd|hdtv|cam')
+_QUALITY_MAP = {
+    'bluray': 'bluray', 'bdrip': 'bluray', 'bdremux': 'bluray',
+    'dvd': 'dvd', 'dvdrip': 'dvd',
+    'hdtv': 'hdtv', 'cam': 'cam',
+}
+
+
+def _json_one(value) -> str:
+    """JSON-encode a single-element string list.
+
+    Skips the json encoder for the common case of values that need no
+    escaping; falls back to json.dumps otherwise.
+    """
+    s = str(value)
+    if '"' in s or '\\' in s or not s.isprintable():
+        return json.dumps([s])
+    return f'["{s}"]'
+
+
+@lru_cache(maxsize=256)
+def _lang_to_alpha2(raw: str, LanguageCls) -> str:
+    """Resolve a filename language code to SubDL's upper-case alpha2 form.
+
+    babelfish walks its CSV-backed tables on every fromalpha2/fromalpha3
+    call; subtitle filenames use a handful of codes, so cache the result.
+    """
+    code = raw.strip().replace('-', '_')
+    try:
+        if len(code) == 2:
+            return LanguageCls.fromalpha2(code.lower()).alpha2.upper()
+        if len(code) == 3:
+            return LanguageCls.fromalpha3(code.lower()).alpha2.upper()
+        return code.upper()
+    except Exception:
+        return raw.upper()
+
 # Timeout configurations per job type (in seconds)
 JOB_TIMEOUTS = {
     JOB_TYPE_EXTRACT: 300,          # 5 minutes
@@ -48,13 +125,107 @@ class JobQueue:
         self.max_parallel = max_parallel
         self.running = False
         self.processor_thread = None
+        self._pool = None
+        self._pool_workers = 0
         self.lock = threading.Lock()
+        self._recent_tracebacks = {}
+        self._local = threading.local()
+        # In-memory view of running jobs: {job_id: (job_type, monotonic start)}.
+        # Lets the scheduler derive the running count and timeout deadlines
+        # without querying the database every tick. Guarded by self.lock.
+        self._running = {}
+        self._cv = threading.Condition()
+        # Wake flag paired with _cv: a notify that fires while the processor
+        # is mid-loop (not parked in wait) would otherwise be lost and the
+        # processor would sleep out its full timeout. Guarded by self._cv.
+        self._wake = False
+        self._next_cleanup = time.monotonic() + 3600
+        self._http = self._build_http_session()
+        # guessit is slow on repeated release names (e.g. a season batch
+        # publishes near-identical basenames); cache parses per name.
+        self._guessit_cache = {}
+        # SubDL n_id per upload token with a short TTL: {token: (n_id, monotonic)}.
+        self._subdl_nid_cache = {}
+        # Serializes settings.json writes across worker threads.
+        self._settings_lock = threading.Lock()
         self._init_db()
         
+    def _build_http_session(self):
+        """Build the shared HTTP session used for provider API calls.
+
+        Publishing to SubDL makes several requests against the same host;
+        a pooled session reuses the TCP+TLS connection across them instead
+        of paying a fresh handshake per call. Transient gateway errors are
+        retried at the transport level.
+        """
+        session = requests.Session()
+        # pool_maxsize tracks the worker count so parallel publish jobs each
+        # keep a warm connection; pool_block makes extra requests wait for a
+        # pooled connection instead of opening throwaway ones.
+        session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(8, self.max_parallel * 2),
+            pool_block=True,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        ))
+        return session
+
+    def _connect(self):
+        """Open a database connection with per-connection pragmas applied.
+
+        isolation_level=None disables the sqlite3 module's implicit
+        transaction management; writers take explicit BEGIN IMMEDIATE
+        transactions via _write_txn and readers run in autocommit, which
+        under WAL never blocks on the writer.
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+
+    def _conn(self):
+        """Get this thread's cached connection, creating it on first use.
+
+        Opening a connection per call re-reads the WAL/shm headers every time;
+        the processor loop alone would do that several times per tick. Each
+        thread keeps one long-lived connection instead (job threads are
+        daemonic, so leaking their connection on thread exit is harmless).
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write_txn(self):
+        """BEGIN IMMEDIATE transaction on this thread's connection"""
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
     def _init_db(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
+        # WAL lets the processor's readers proceed while a status update
+        # commits; the mode is persistent so setting it once here is enough
+        cursor.execute('PRAGMA journal_mode=WAL')
+        # Incremental auto-vacuum lets cleanup_old_jobs hand freed pages back
+        # instead of the file growing forever. The setting only takes effect
+        # on an empty database, so migrate an existing file with a one-time
+        # VACUUM (2 = INCREMENTAL)
+        if cursor.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+            cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            cursor.execute('VACUUM')
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS jobs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -69,39 +240,46 @@ class JobQueue:
                 result TEXT
             )
         ''')
+        # Compound indexes match the status + order-by shape of every hot
+        # query, so SQLite can stream rows from the index without sorting.
+        # The old single-column indexes are dropped on existing databases.
+        cursor.execute('DROP INDEX IF EXISTS idx_status')
+        cursor.execute('DROP INDEX IF EXISTS idx_created_at')
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_status ON jobs(status)
+            CREATE INDEX IF NOT EXISTS idx_status_created ON jobs(status, created_at)
         ''')
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_created_at ON jobs(created_at)
+            CREATE INDEX IF NOT EXISTS idx_status_started ON jobs(status, started_at)
         ''')
-        conn.commit()
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_status_completed ON jobs(status, completed_at)
+        ''')
+        cursor.execute('ANALYZE')
         conn.close()
         
     def add_job(self, job_type: str, file_path: str, params: Dict = None) -> int:
         """Add a new job to the queue"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO jobs (job_type, status, file_path, params, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            job_type,
-            STATUS_PENDING,
-            file_path,
-            json.dumps(params) if params else None,
-            datetime.now().isoformat()
-        ))
-        job_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        # Marshal outside the transaction so the write lock is held only for
+        # the INSERT itself
+        params_json = json.dumps(params, separators=(',', ':')) if params else None
+        created_at = datetime.now().isoformat()
+        with self._write_txn() as conn:
+            cursor = conn.execute('''
+                INSERT INTO jobs (job_type, status, file_path, params, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (job_type, STATUS_PENDING, file_path, params_json, created_at))
+            job_id = cursor.lastrowid
         logging.info(f'Added job {job_id}: {job_type} for {file_path}')
+        # Wake the processor so the job starts immediately instead of on the
+        # next poll interval
+        with self._cv:
+            self._wake = True
+            self._cv.notify()
         return job_id
     
     def get_pending_jobs(self, limit: int = 10) -> List[Dict]:
         """Get pending jobs"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         cursor.execute('''
             SELECT * FROM jobs 
@@ -109,29 +287,45 @@ class JobQueue:
             ORDER BY created_at ASC 
             LIMIT ?
         ''', (STATUS_PENDING, limit))
-        jobs = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return jobs
+        return [dict(row) for row in cursor.fetchall()]
     
+    def claim_pending_jobs(self, limit: int) -> List[Dict]:
+        """Atomically move up to `limit` pending jobs to running and return them.
+
+        A single UPDATE ... RETURNING claims the jobs, so even a second
+        processor could never grab the same job between a SELECT and the
+        status update.
+        """
+        with self._write_txn() as conn:
+            cursor = conn.execute('''
+                UPDATE jobs
+                SET status = ?, started_at = ?
+                WHERE id IN (
+                    SELECT id FROM jobs
+                    WHERE status = ?
+                    ORDER BY created_at ASC
+                    LIMIT ?
+                )
+                RETURNING *
+            ''', (STATUS_RUNNING, datetime.now().isoformat(), STATUS_PENDING, limit))
+            jobs = [dict(row) for row in cursor.fetchall()]
+        return jobs
+
     def get_running_jobs(self) -> List[Dict]:
         """Get currently running jobs"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         cursor.execute('''
             SELECT * FROM jobs 
             WHERE status = ? 
             ORDER BY started_at ASC
         ''', (STATUS_RUNNING,))
-        jobs = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return jobs
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_recent_failed_jobs(self, hours: int = 1) -> List[Dict]:
         """Get jobs that failed in the last N hours"""
         cutoff = (datetime.now() - timedelta(hours=hours)).isoformat()
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         cursor.execute('''
             SELECT * FROM jobs 
@@ -139,103 +333,94 @@ class JobQueue:
             AND completed_at > ?
             ORDER BY completed_at DESC
         ''', (STATUS_FAILED, STATUS_TIMEOUT, cutoff))
-        jobs = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return jobs
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_all_jobs(self, limit: int = 100) -> List[Dict]:
         """Get all jobs (for admin view)"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         cursor.execute('''
             SELECT * FROM jobs 
             ORDER BY created_at DESC 
             LIMIT ?
         ''', (limit,))
-        jobs = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return jobs
+        return [dict(row) for row in cursor.fetchall()]
     
     def update_job_status(self, job_id: int, status: str, error_message: str = None, result: str = None):
         """Update job status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        updates = ['status = ?']
-        params = [status]
-        
-        if status == STATUS_RUNNING:
-            updates.append('started_at = ?')
-            params.append(datetime.now().isoformat())
-        elif status in [STATUS_COMPLETED, STATUS_FAILED, STATUS_TIMEOUT]:
-            updates.append('completed_at = ?')
-            params.append(datetime.now().isoformat())
-        
-        if error_message is not None:
-            updates.append('error_message = ?')
-            params.append(error_message)
-        
-        if result is not None:
-            updates.append('result = ?')
-            params.append(result)
-        
-        params.append(job_id)
-        
-        cursor.execute(f'''
-            UPDATE jobs 
-            SET {', '.join(updates)}
-            WHERE id = ?
-        ''', params)
-        conn.commit()
-        conn.close()
+        now = datetime.now().isoformat()
+        terminal = status in (STATUS_COMPLETED, STATUS_FAILED, STATUS_TIMEOUT)
+
+        if status == STATUS_RUNNING and error_message is None and result is None:
+            sql = _SQL_MARK_RUNNING
+            params = (status, now, job_id)
+        elif terminal and result is not None and error_message is None:
+            sql = _SQL_MARK_DONE_RESULT
+            params = (status, now, result, job_id)
+        elif terminal and error_message is not None and result is None:
+            sql = _SQL_MARK_DONE_ERROR
+            params = (status, now, error_message, job_id)
+        else:
+            # Uncommon shape; build the statement dynamically
+            updates = ['status = ?']
+            params = [status]
+            if status == STATUS_RUNNING:
+                updates.append('started_at = ?')
+                params.append(now)
+            elif terminal:
+                updates.append('completed_at = ?')
+                params.append(now)
+            if error_message is not None:
+                updates.append('error_message = ?')
+                params.append(error_message)
+            if result is not None:
+                updates.append('result = ?')
+                params.append(result)
+            params.append(job_id)
+            sql = f"UPDATE jobs SET {', '.join(updates)} WHERE id = ?"
+
+        with self._write_txn() as conn:
+            conn.execute(sql, params)
     
     def delete_job(self, job_id: int) -> bool:
         """Delete a job (only if pending)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT status FROM jobs WHERE id = ?', (job_id,))
-        row = cursor.fetchone()
-        
-        if not row:
-            conn.close()
-            return False
-        
-        if row[0] != STATUS_PENDING:
-            conn.close()
-            return False
-        
-        cursor.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
-        conn.commit()
-        conn.close()
+        with self._write_txn() as conn:
+            cursor = conn.execute('SELECT status FROM jobs WHERE id = ?', (job_id,))
+            row = cursor.fetchone()
+
+            if not row:
+                return False
+
+            if row[0] != STATUS_PENDING:
+                return False
+
+            conn.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
         logging.info(f'Deleted job {job_id}')
         return True
     
     def cleanup_old_jobs(self, days: int = 7):
         """Clean up completed/failed jobs older than N days"""
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            DELETE FROM jobs 
-            WHERE (status = ? OR status = ? OR status = ?)
-            AND completed_at < ?
-        ''', (STATUS_COMPLETED, STATUS_FAILED, STATUS_TIMEOUT, cutoff))
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._write_txn() as conn:
+            cursor = conn.execute('''
+                DELETE FROM jobs
+                WHERE (status = ? OR status = ? OR status = ?)
+                AND completed_at < ?
+            ''', (STATUS_COMPLETED, STATUS_FAILED, STATUS_TIMEOUT, cutoff))
+            deleted = cursor.rowcount
         if deleted > 0:
+            # Reclaim the freed pages and truncate the WAL after a bulk delete
+            conn = self._conn()
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            conn.execute('PRAGMA incremental_vacuum')
             logging.info(f'Cleaned up {deleted} old jobs')
         return deleted
 
     def clear_jobs(self) -> int:
         """Delete all persisted jobs from the queue database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM jobs')
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._write_txn() as conn:
+            cursor = conn.execute('DELETE FROM jobs')
+            deleted = cursor.rowcount
         logging.info(f'Cleared {deleted} job(s) from queue database')
         return deleted
     
@@ -245,68 +430,153 @@ class JobQueue:
             return
         
         self.running = True
+        self._next_cleanup = time.monotonic() + 3600
+        self._recover_stale_running_jobs()
+        self._ensure_pool()
         self.processor_thread = threading.Thread(target=self._process_jobs, daemon=True)
         self.processor_thread.start()
         logging.info(f'Job processor started with max_parallel={self.max_parallel}')
     
+    def _recover_stale_running_jobs(self):
+        """Fail 'running' rows left behind by a crashed or restarted process.
+
+        Timeout sweeping works off the in-memory _running map, so a row
+        stuck in running from a previous process would otherwise show as
+        running forever and never be reclaimed by cleanup_old_jobs (which
+        only targets terminal states).
+        """
+        with self.lock:
+            known = set(self._running)
+        completed_at = datetime.now().isoformat()
+        with self._write_txn() as conn:
+            cursor = conn.execute('SELECT id FROM jobs WHERE status = ?', (STATUS_RUNNING,))
+            stale = [row[0] for row in cursor.fetchall() if row[0] not in known]
+            conn.executemany('''
+                UPDATE jobs
+                SET status = ?, completed_at = ?, error_message = ?
+                WHERE id = ?
+            ''', [(STATUS_FAILED, completed_at,
+                   'Job was orphaned by a processor restart', job_id)
+                  for job_id in stale])
+        if stale:
+            logging.warning(f'Marked {len(stale)} orphaned running job(s) as failed')
+
     def stop_processor(self):
         """Stop the background job processor"""
         self.running = False
+        with self._cv:
+            self._wake = True
+            self._cv.notify()
         if self.processor_thread:
             self.processor_thread.join(timeout=5)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._pool_workers = 0
         logging.info('Job processor stopped')
+
+    def _ensure_pool(self):
+        """Create the worker pool, growing it if max_parallel was raised.
+
+        max_parallel is mutable at runtime via the settings UI; a larger pool
+        is harmless because scheduling is gated by max_parallel anyway.
+        """
+        if self._pool is None or self._pool_workers < self.max_parallel:
+            old_pool = self._pool
+            self._pool = ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix='jobq')
+            self._pool_workers = self.max_parallel
+            if old_pool is not None:
+                old_pool.shutdown(wait=False)
     
     def _process_jobs(self):
         """Background thread that processes jobs"""
         while self.running:
+            wait_timeout = 2.0
             try:
                 # Check for running jobs and update timeouts
                 self._check_timeouts()
-                
+
                 # Get current running count
-                running_jobs = self.get_running_jobs()
-                running_count = len(running_jobs)
-                
+                with self.lock:
+                    running_count = len(self._running)
+
                 # Start new jobs if capacity available
                 if running_count < self.max_parallel:
                     slots_available = self.max_parallel - running_count
-                    pending_jobs = self.get_pending_jobs(limit=slots_available)
-                    
-                    for job in pending_jobs:
-                        if not self.running:
-                            break
+                    for job in self.claim_pending_jobs(slots_available):
                         self._start_job(job)
-                
-                # Clean up old jobs periodically
-                if int(time.time()) % 3600 == 0:  # Every hour
+
+                # Clean up old jobs once per hour
+                now = time.monotonic()
+                if now >= self._next_cleanup:
                     self.cleanup_old_jobs()
-                
+                    self._next_cleanup = now + 3600
+
+                wait_timeout = self._seconds_until_next_timeout()
+
             except Exception as e:
                 logging.exception(f'Error in job processor: {e}')
-            
-            time.sleep(2)  # Check every 2 seconds
+
+            # Sleep until the earliest running job could time out, or until
+            # add_job / a finishing job notifies us that the schedule changed.
+            # The wake flag catches notifies that fired while we were busy
+            # above, so those schedule changes are handled immediately
+            # instead of after the full wait timeout.
+            with self._cv:
+                if self.running and not self._wake:
+                    self._cv.wait(timeout=wait_timeout)
+                self._wake = False
+
+    def _seconds_until_next_timeout(self) -> float:
+        """Seconds until the earliest running job can hit its timeout (capped)"""
+        now = time.monotonic()
+        with self.lock:
+            deadlines = [
+                started + JOB_TIMEOUTS.get(job_type, 600) - now
+                for job_type, started in self._running.values()
+            ]
+        if not deadlines:
+            return 60.0
+        return min(max(min(deadlines), 0.5), 60.0)
     
     def _check_timeouts(self):
         """Check for jobs that have exceeded their timeout"""
-        running_jobs = self.get_running_jobs()
-        for job in running_jobs:
-            timeout = JOB_TIMEOUTS.get(job['job_type'], 600)
-            started_at = datetime.fromisoformat(job['started_at'])
-            elapsed = (datetime.now() - started_at).total_seconds()
-            
+        now = time.monotonic()
+        with self.lock:
+            running = list(self._running.items())
+        timed_out = []
+        for job_id, (job_type, started) in running:
+            timeout = JOB_TIMEOUTS.get(job_type, 600)
+            elapsed = now - started
+
             if elapsed > timeout:
-                self.update_job_status(
-                    job['id'],
-                    STATUS_TIMEOUT,
-                    error_message=f'Job exceeded timeout of {timeout}s'
-                )
-                logging.warning(f'Job {job["id"]} timed out after {elapsed}s')
+                timed_out.append((job_id, f'Job exceeded timeout of {timeout}s'))
+                logging.warning(f'Job {job_id} timed out after {elapsed}s')
+
+        if not timed_out:
+            return
+
+        # Timed-out jobs no longer count against max_parallel
+        with self.lock:
+            for job_id, _ in timed_out:
+                self._running.pop(job_id, None)
+
+        # Mark all timed-out jobs in one transaction instead of one
+        # connection/commit per job
+        completed_at = datetime.now().isoformat()
+        with self._write_txn() as conn:
+            conn.executemany('''
+                UPDATE jobs
+                SET status = ?, completed_at = ?, error_message = ?
+                WHERE id = ?
+            ''', [(STATUS_TIMEOUT, completed_at, message, job_id) for job_id, message in timed_out])
     
     def _start_job(self, job: Dict):
-        """Start processing a job in a separate thread"""
-        self.update_job_status(job['id'], STATUS_RUNNING)
-        thread = threading.Thread(target=self._execute_job, args=(job,), daemon=True)
-        thread.start()
+        """Hand an already-claimed job to the worker pool"""
+        with self.lock:
+            self._running[job['id']] = (job['job_type'], time.monotonic())
+        self._ensure_pool()
+        self._pool.submit(self._execute_job, job)
     
     def _execute_job(self, job: Dict):
         """Execute a specific job"""
@@ -342,6 +612,13 @@ class JobQueue:
             error_msg = str(e)
             self.update_job_status(job_id, STATUS_FAILED, error_message=error_msg)
             logging.error(f'Job {job_id} failed: {error_msg}')
+        finally:
+            with self.lock:
+                self._running.pop(job_id, None)
+            # A slot just freed up; let the processor schedule the next job
+            with self._cv:
+                self._wake = True
+                self._cv.notify()
     
     def _execute_extract(self, file_path: str, params: Dict) -> Dict:
         """Execute subtitle extraction job - extracts ALL subtitles in the configured language"""
@@ -363,39 +640,47 @@ class JobQueue:
             '-show_streams', '-select_streams', 's', video_path
         ]
         
-        probe_result = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=30)
-        if probe_result.returncode != 0:
-            raise RuntimeError(f'ffprobe failed: {probe_result.stderr}')
-        
-        probe_data = json.loads(probe_result.stdout)
+        # communicate() keeps the 30s deadline over the whole probe; a hung
+        # ffprobe must not pin a worker thread for good
+        with subprocess.Popen(probe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as probe_proc:
+            try:
+                probe_out, stderr_tail = probe_proc.communicate(timeout=30)
+            except subprocess.TimeoutExpired:
+                probe_proc.kill()
+                probe_proc.communicate()
+                raise
+            if probe_proc.returncode != 0:
+                raise RuntimeError(f'ffprobe failed: {stderr_tail.decode("utf-8", errors="replace")}')
+        try:
+            probe_data = json.loads(probe_out)
+        except ValueError:
+            probe_data = {}
+
         streams = probe_data.get('streams', [])
         
         # Find ALL subtitle streams matching the configured language
         # Priority: text subtitles first (SRT/ASS/etc.), then bitmap (PGS, then VobSub)
-        text_codecs = ['subrip', 'ass', 'ssa', 'mov_text', 'webvtt']
-        
-        matching_subs = []
-        
-        # 1) Collect all text-based subtitles in configured language
-        for idx, stream in enumerate(streams):
-            codec = stream.get('codec_name', '')
-            lang = (stream.get('tags', {}).get('language', '') or '').lower()
-            if codec in text_codecs and lang == extraction_source_language.lower():
-                matching_subs.append((idx, stream, 'text'))
-        
-        # 2) Collect all PGS (Blu‑ray bitmap) in configured language
-        for idx, stream in enumerate(streams):
-            codec = stream.get('codec_name', '')
-            lang = (stream.get('tags', {}).get('language', '') or '').lower()
-            if codec == 'hdmv_pgs_subtitle' and lang == extraction_source_language.lower():
-                matching_subs.append((idx, stream, 'pgs'))
-        
-        # 3) Collect all VobSub (DVD bitmap) in configured language
+        text_codecs = frozenset(['subrip', 'ass', 'ssa', 'mov_text', 'webvtt'])
+        want_lang = extraction_source_language.lower()
+
+        # Single pass over the streams, bucketed by codec group and
+        # concatenated in priority order
+        text_subs = []
+        pgs_subs = []
+        vobsub_subs = []
         for idx, stream in enumerate(streams):
+            lang = (stream.get('tags', {}).get('language') or '').lower()
+            if lang != want_lang:
+                continue
             codec = stream.get('codec_name', '')
-            lang = (stream.get('tags', {}).get('language', '') or '').lower()
-            if codec == 'dvd_subtitle' and lang == extraction_source_language.lower():
-                matching_subs.append((idx, stream, 'vobsub'))
+            if codec in text_codecs:
+                text_subs.append((idx, stream, 'text'))
+            elif codec == 'hdmv_pgs_subtitle':
+                pgs_subs.append((idx, stream, 'pgs'))
+            elif codec == 'dvd_subtitle':
+                vobsub_subs.append((idx, stream, 'vobsub'))
+
+        matching_subs = text_subs + pgs_subs + vobsub_subs
         
         if not matching_subs:
             raise RuntimeError(f'No subtitle streams found for language "{extraction_source_language}"')
@@ -419,7 +704,7 @@ class JobQueue:
                 # Extract to .sup file for PGS
                 output_path = base_noext + suffix + '.sup'
                 extract_cmd = [
-                    'ffmpeg', '-y', '-analyzeduration', '200M', '-probesize', '50M',
+                    'ffmpeg', '-y', '-nostats', '-analyzeduration', '200M', '-probesize', '50M',
                     '-i', video_path, '-map', f'0:s:{sub_order}',
                     '-c:s', 'copy', output_path
                 ]
@@ -441,16 +726,20 @@ class JobQueue:
                 # Extract to .srt file for text-based subtitles
                 output_path = base_noext + suffix + '.srt'
                 extract_cmd = [
-                    'ffmpeg', '-y', '-analyzeduration', '200M', '-probesize', '50M',
+                    'ffmpeg', '-y', '-nostats', '-analyzeduration', '200M', '-probesize', '50M',
                     '-i', video_path, '-map', f'0:s:{sub_order}',
                     '-c:s', 'srt', output_path
                 ]
                 logging.info(f'Extracting text subtitle track {sub_order} to SRT: {os.path.basename(output_path)}')
             
-            extract_result = subprocess.run(extract_cmd, capture_output=True, text=True, timeout=300)
-            
+            # stdout carries only progress chatter; keep stderr for diagnostics
+            extract_result = subprocess.run(
+                extract_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                text=True, timeout=300
+            )
+
             if extract_result.returncode != 0:
-                logging.error(f'Failed to extract track {sub_order}: {extract_result.stderr or extract_result.stdout}')
+                logging.error(f'Failed to extract track {sub_order}: {extract_result.stderr}')
                 continue
             
             if not os.path.exists(output_path):
@@ -569,8 +858,7 @@ class JobQueue:
             raise RuntimeError(f'Translation failed: {message}')
 
         # Generate output filename with target language code
-        base_name = os.path.splitext(file_path)[0]
-        ext = os.path.splitext(file_path)[1]
+        base_name, ext = os.path.splitext(file_path)
         output_rel_path = f"{base_name}.{target_lang}{ext}"
 
         return {
@@ -701,7 +989,8 @@ class JobQueue:
         # Build serializable subtitle list (without subtitle_object)
         subtitle_list = []
         for sub in all_subtitles:
-            sub_copy = {k: v for k, v in sub.items() if k != 'subtitle_object'}
+            sub_copy = sub.as_dict()
+            del sub_copy['subtitle_object']
             subtitle_list.append(sub_copy)
 
         return {
@@ -843,10 +1132,10 @@ class JobQueue:
     
     def _execute_publish_subtitles(self, file_path: str, params: Dict) -> Dict:
         """Execute subtitle publish job (uploads to enabled providers that support upload)."""
-        import json
-        import requests
-        from guessit import guessit
-        from babelfish import Language
+        if guessit is None or Language is None:
+            raise RuntimeError(
+                "Publishing requires the 'guessit' and 'babelfish' packages. Install them to use this feature."
+            )
 
         base_dir = params.get('base_dir')
         settings_file = params.get('settings_file')
@@ -899,11 +1188,6 @@ class JobQueue:
         }
 
     def _publish_to_subdl(self, subtitle_abs_path: str, target: Dict, token: str, guessit_func, LanguageCls, comment: str = '') -> Dict:
-        import os
-        import json
-        import requests
-        import re
-
         t = (token or '').strip()
         bearer = t
         if t.lower().startswith('bearer '):
@@ -912,17 +1196,24 @@ class JobQueue:
             bare = t
         bearer = f'Bearer {bare}'
 
-        # Step 1: get n_id
-        step1_url = 'https://api3.subdl.com/user/getNId'
-        logging.info('SubDL REST call: GET %s (headers: token=***)', step1_url)
-        r1 = requests.get(step1_url, headers={'token': bare}, timeout=30)
-        logging.info('SubDL REST response: GET %s status_code=%s', step1_url, r1.status_code)
-        r1.raise_for_status()
-        p1 = r1.json() or {}
-        if not p1.get('ok') or not p1.get('n_id'):
-            raise RuntimeError(p1.get('error') or 'Failed to get SubDL n_id')
-        n_id = p1.get('n_id')
-        logging.info('SubDL step1 ok (n_id=%s)', n_id)
+        # Step 1: get n_id (cached for 60s so batch publishes with the same
+        # token skip the extra round trip per file)
+        cached = self._subdl_nid_cache.get(bare)
+        if cached is not None and time.monotonic() - cached[1] < 60:
+            n_id = cached[0]
+            logging.info('SubDL step1 ok (cached n_id=%s)', n_id)
+        else:
+            step1_url = 'https://api3.subdl.com/user/getNId'
+            logging.info('SubDL REST call: GET %s (headers: token=***)', step1_url)
+            r1 = self._http.get(step1_url, headers={'token': bare}, timeout=30)
+            logging.info('SubDL REST response: GET %s status_code=%s', step1_url, r1.status_code)
+            r1.raise_for_status()
+            p1 = r1.json() or {}
+            if not p1.get('ok') or not p1.get('n_id'):
+                raise RuntimeError(p1.get('error') or 'Failed to get SubDL n_id')
+            n_id = p1.get('n_id')
+            self._subdl_nid_cache[bare] = (n_id, time.monotonic())
+            logging.info('SubDL step1 ok (n_id=%s)', n_id)
 
         # Step 2: upload file
         try:
@@ -941,16 +1232,35 @@ class JobQueue:
             n_id,
             os.path.basename(subtitle_abs_path)
         )
+        try:
+            from requests_toolbelt.multipart.encoder import MultipartEncoder
+        except ImportError:
+            MultipartEncoder = None
+
         with open(subtitle_abs_path, 'rb') as f:
-            files = {'subtitle': (os.path.basename(subtitle_abs_path), f)}
-            data = {'n_id': n_id}
-            r2 = requests.post(
-                step2_url,
-                headers={'token': bare},
-                files=files,
-                data=data,
-                timeout=120
-            )
+            if MultipartEncoder is not None:
+                # Stream the multipart body from the file instead of
+                # buffering the whole upload in memory.
+                body = MultipartEncoder(fields={
+                    'n_id': str(n_id),
+                    'subtitle': (os.path.basename(subtitle_abs_path), f, 'application/x-subrip'),
+                })
+                r2 = self._http.post(
+                    step2_url,
+                    headers={'token': bare, 'Content-Type': body.content_type},
+                    data=body,
+                    timeout=120
+                )
+            else:
+                files = {'subtitle': (os.path.basename(subtitle_abs_path), f)}
+                data = {'n_id': n_id}
+                r2 = self._http.post(
+                    step2_url,
+                    headers={'token': bare},
+                    files=files,
+                    data=data,
+                    timeout=120
+                )
 
         logging.info('SubDL REST response: POST %s status_code=%s', step2_url, r2.status_code)
         r2.raise_for_status()
@@ -970,33 +1280,28 @@ class JobQueue:
 
         # Language guess from filename: *.en.srt, *.eng.srt
         lang_guess = None
-        m = re.search(r'\.([a-zA-Z]{2,3})(?:\.[0-9]+)?$', stem)
+        m = _LANG_SUFFIX_RE.search(stem)
         if m:
             lang_guess = m.group(1)
 
         lang = 'EN'
         if lang_guess:
-            try:
-                code = str(lang_guess).strip().replace('-', '_')
-                if len(code) == 2:
-                    lang = LanguageCls.fromalpha2(code.lower()).alpha2.upper()
-                elif len(code) == 3:
-                    lang = LanguageCls.fromalpha3(code.lower()).alpha2.upper()
-                else:
-                    lang = code.upper()
-            except Exception:
-                lang = str(lang_guess).upper()
+            lang = _lang_to_alpha2(str(lang_guess), LanguageCls)
 
         # release string: try stripping language suffix
         release_name = stem
         if lang_guess and release_name.lower().endswith('.' + lang_guess.lower()):
             release_name = release_name[:-(len(lang_guess) + 1)]
 
-        guess = {}
-        try:
-            guess = guessit_func(release_name) or {}
-        except Exception:
-            guess = {}
+        guess = self._guessit_cache.get(release_name)
+        if guess is None:
+            try:
+                guess = guessit_func(release_name) or {}
+            except Exception:
+                guess = {}
+            if len(self._guessit_cache) >= 512:
+                self._guessit_cache.clear()
+            self._guessit_cache[release_name] = guess
 
         content_type = str((target or {}).get('type') or '').strip().lower()
         if content_type not in ['movie', 'tv']:
@@ -1027,33 +1332,26 @@ class JobQueue:
 
         # Quality inference
         low = release_name.lower()
-        quality = 'web'
-        if 'bluray' in low or 'bdrip' in low or 'bdremux' in low:
-            quality = 'bluray'
-        elif 'dvd' in low or 'dvdrip' in low:
-            quality = 'dvd'
-        elif 'hdtv' in low:
-            quality = 'hdtv'
-        elif 'cam' in low:
-            quality = 'cam'
-
-        hi = bool(re.search(r'\b(hi|sdh)\b', low))
+        qm = _QUALITY_RE.search(low)
+        quality = _QUALITY_MAP[qm.group(0)] if qm else 'web'
+
+        hi = bool(_HI_RE.search(low))
 
         form = {
-            'file_n_ids': json.dumps([file_n_id]),
+            'file_n_ids': _json_one(file_n_id),
             'n_id': n_id,
             'type': content_type,
             'quality': quality,
             'production_type': 3, # 3 = Machine translated
             'name': title,
-            'releases': json.dumps([release_name]),
+            'releases': _json_one(release_name),
             'framerate': 0,
             'comment': str(comment or ''),
             'lang': lang,
             'season': season,
             'hi': str(hi).lower(),
             'is_full_season': 'false',
-            'tags': json.dumps([])
+            'tags': '[]'
         }
         if tmdb_id:
             form['tmdb_id'] = tmdb_id
@@ -1101,7 +1399,7 @@ class JobQueue:
             form.get('hi')
         )
 
-        r3 = requests.post(
+        r3 = self._http.post(
             step3_url,
             headers={'Authorization': bearer, 'Accept': 'application/json'},
             data=form,
@@ -1110,23 +1408,44 @@ class JobQueue:
         logging.info('SubDL REST response: POST %s status_code=%s', step3_url, r3.status_code)
         r3.raise_for_status()
 
-        try:
-            p3 = r3.json() or {}
-            if isinstance(p3, dict) and p3.get('ok') is False:
+        p3 = None
+        if (r3.headers.get('Content-Type') or '').lower().startswith('application/json'):
+            try:
+                p3 = r3.json() or {}
+            except ValueError:
+                p3 = None
+        if isinstance(p3, dict):
+            if p3.get('ok') is False:
                 raise RuntimeError(p3.get('error') or p3.get('message') or 'SubDL uploadSubtitle failed')
-            if isinstance(p3, dict) and p3.get('ok'):
+            if p3.get('ok'):
                 logging.info('SubDL step3 ok (message=%s)', p3.get('message') or p3.get('msg') or 'ok')
                 return p3
-        except ValueError:
-            p3 = None
 
-        text = (r3.text or '').strip()
+        # Decode the body directly; .text would re-run charset detection on
+        # a body we have already read.
+        text = r3.content.decode('utf-8', errors='replace').strip()
         if text:
             logging.info('SubDL step3 ok (text_response=%s)', text[:300])
             return {'ok': True, 'message': text}
         logging.info('SubDL step3 ok (empty_response=subtitle sent for review)')
         return {'ok': True, 'message': 'subtitle sent for review'}
 
+    def _log_error_throttled(self, msg: str, exc: Exception):
+        """Log an error, attaching the full traceback only on the first
+        occurrence of this error within 60s.
+
+        Formatting a traceback is expensive; when a provider is down and many
+        jobs fail with the same error in quick succession, one traceback per
+        minute is enough.
+        """
+        key = f'{type(exc).__name__}:{str(exc)[:80]}'
+        now = time.time()
+        if now - self._recent_tracebacks.get(key, 0.0) >= 60:
+            self._recent_tracebacks[key] = now
+            logging.error(msg, exc, exc_info=True)
+        else:
+            logging.error(msg, exc)
+
     def _translate_with_google_local(self, source_path, dest_path, target_lang):
         """
         Execute translation using local GoogleTranslate implementation
@@ -1148,13 +1467,16 @@ class JobQueue:
                 if current % 10 == 0 or current == total:
                     logging.info(f'GoogleTranslate progress: {current}/{total} lines')
             
-            # Create translator with destination path
+            # Create translator with destination path. Translation is
+            # network-bound, so scale the thread count with the machine
+            # instead of hard-coding it.
+            max_workers = min(32, (os.cpu_count() or 4) * 4)
             translator = LocalGoogleTranslator(
                 source_srt_file=source_path,
                 dest_srt_file=dest_path,
                 target_lang=target_lang,
                 source_lang='auto',
-                max_workers=10
+                max_workers=max_workers
             )
             
             # Execute translation
@@ -1167,87 +1489,121 @@ class JobQueue:
             logging.error('Make sure dependencies are installed: pip install deep-translator pysubs2 beautifulsoup4 retry')
             return False
         except Exception as e:
-            logging.error(f'Local GoogleTranslate failed: {e}', exc_info=True)
+            self._log_error_throttled('Local GoogleTranslate failed: %s', e)
             return False
     
+    def _save_settings(self, settings_file, settings):
+        """Atomically persist settings to disk.
+
+        Writes a sibling temp file and os.replace()s it over the target, so
+        concurrent readers never observe a partially written file. Guarded by
+        _settings_lock because several worker threads can mutate settings.
+        """
+        with self._settings_lock:
+            tmp_path = f'{settings_file}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dump_settings(settings))
+            os.replace(tmp_path, settings_file)
+
     def _translate_with_failover(self, file_path, settings, base_dir, target_lang, settings_file, vpn_dir=None):
         """Translation with automatic failover between providers and API keys using local translation"""
         from datetime import datetime
         import json
-        from translation_providers import translate_srt_file
-        
+
         provider = settings.get('provider', 'DeepL')
         max_attempts = 2
-        
-        for attempt in range(max_attempts):
-            # Get active API key
-            provider_keys = settings.get('provider_keys', {})
-            active_key_info = None
-            
-            if provider in ['DeepL', 'Azure', 'Gemini']:
-                keys_list = provider_keys.get(provider, [])
-                if not keys_list:
-                    return False, f'No API keys configured for {provider}'
-                active_key_info = next((k for k in keys_list if k.get('active')), None)
-                if not active_key_info:
-                    return False, f'No active API key for {provider}'
-            
-            # Run translation using local translation_providers
-            success, error_msg = self._run_local_translation(
-                file_path, provider, active_key_info, settings, base_dir, target_lang, vpn_dir
-            )
-            
-            if success:
-                # Update last_used timestamp
-                if active_key_info:
-                    active_key_info['last_used'] = datetime.now().isoformat()
-                with open(settings_file, 'w', encoding='utf-8') as f:
-                    json.dump(settings, f, indent=2)
-                return True, 'Translation completed'
-            
-            logging.warning(f'Translation failed with {provider}: {error_msg}')
-            
-            # Handle failover - try next API key or provider
-            switched = False
-            
-            if provider in ['DeepL', 'Azure', 'Gemini'] and active_key_info:
-                auto_change = settings.get('auto_change_key_on_error', {}).get(provider, False)
-                if auto_change:
-                    # Switch to next key
+        # Settings mutations (key rotation, provider switch, last_used) are
+        # buffered and flushed once on exit instead of rewriting the file on
+        # every attempt.
+        dirty = False
+
+        # Resolve settings sub-dicts once instead of re-allocating defaults per attempt
+        auto_change_map = settings.get('auto_change_key_on_error') or {}
+        auto_switch_provider = settings.get('auto_switch_on_error', False)
+
+        # Track what has already failed so we bail out early instead of burning
+        # attempts (and VPN start/stop cycles) re-trying exhausted keys/providers
+        tried_keys = {}
+        tried_providers = set()
+
+        try:
+            for attempt in range(max_attempts):
+                # Get active API key
+                provider_keys = settings.get('provider_keys', {})
+                active_key_info = None
+
+                keys_list = []
+                active_idx = -1
+                if provider in ['DeepL', 'Azure', 'Gemini']:
                     keys_list = provider_keys.get(provider, [])
-                    current_idx = next((i for i, k in enumerate(keys_list) if k.get('active')), -1)
-                    if current_idx >= 0:
-                        keys_list[current_idx]['active'] = False
-                        next_idx = (current_idx + 1) % len(keys_list)
+                    if not keys_list:
+                        return False, f'No API keys configured for {provider}'
+                    # Resolve the active index once per attempt; the failover
+                    # block below reuses it instead of rescanning the list.
+                    active_idx = next((i for i, k in enumerate(keys_list) if k.get('active')), -1)
+                    if active_idx < 0:
+                        return False, f'No active API key for {provider}'
+                    active_key_info = keys_list[active_idx]
+
+                # Run translation using local translation_providers
+                success, error_msg = self._run_local_translation(
+                    file_path, provider, active_key_info, settings, base_dir, target_lang, vpn_dir
+                )
+
+                if success:
+                    # Update last_used timestamp
+                    if active_key_info:
+                        active_key_info['last_used'] = datetime.now().isoformat()
+                        dirty = True
+                    return True, 'Translation completed'
+
+                logging.warning('Translation failed with %s: %s', provider, error_msg)
+
+                # Handle failover - try next API key or provider
+                switched = False
+
+                if provider in ['DeepL', 'Azure', 'Gemini'] and active_key_info:
+                    auto_change = auto_change_map.get(provider, False)
+                    if auto_change:
+                        # Switch to next key
+                        failed_keys = tried_keys.setdefault(provider, set())
+                        failed_keys.add(active_key_info.get('value', ''))
+                        if len(failed_keys) >= len(keys_list):
+                            return False, f'All API keys for {provider} exhausted: {error_msg}'
+                        active_key_info['active'] = False
+                        next_idx = (active_idx + 1) % len(keys_list)
                         keys_list[next_idx]['active'] = True
                         switched = True
-                        logging.info(f'Switched to next API key for {provider}')
-            
-            if not switched:
-                auto_switch_provider = settings.get('auto_switch_on_error', False)
-                if auto_switch_provider and attempt < max_attempts - 1:
-                    # Switch provider
-                    providers = ['DeepL', 'Azure', 'Gemini']
-                    current_idx = providers.index(provider) if provider in providers else 0
-                    next_provider = providers[(current_idx + 1) % len(providers)]
-                    settings['provider'] = next_provider
-                    provider = next_provider
-                    switched = True
-                    logging.info(f'Switched to provider {provider}')
-            
-            if switched:
-                with open(settings_file, 'w', encoding='utf-8') as f:
-                    json.dump(settings, f, indent=2)
-                continue
-            else:
-                return False, error_msg
-        
-        return False, 'Translation failed after all attempts'
+                        dirty = True
+                        logging.info('Switched to next API key for %s', provider)
+
+                if not switched:
+                    if auto_switch_provider and attempt < max_attempts - 1:
+                        # Switch provider
+                        tried_providers.add(provider)
+                        providers = ['DeepL', 'Azure', 'Gemini']
+                        current_idx = providers.index(provider) if provider in providers else 0
+                        next_provider = providers[(current_idx + 1) % len(providers)]
+                        if next_provider in tried_providers:
+                            return False, f'All providers exhausted: {error_msg}'
+                        settings['provider'] = next_provider
+                        provider = next_provider
+                        switched = True
+                        dirty = True
+                        logging.info('Switched to provider %s', provider)
+
+                if switched:
+                    continue
+                else:
+                    return False, error_msg
+
+            return False, 'Translation failed after all attempts'
+        finally:
+            if dirty:
+                self._save_settings(settings_file, settings)
     
     def _run_local_translation(self, file_path, provider, key_info, settings, base_dir, target_lang, vpn_dir=None):
         """Run translation using local translation_providers module with optional VPN"""
-        from translation_providers import translate_srt_file, start_vpn, stop_vpn
-        
         api_key = ''
         vpn_config_path = None
         vpn_started = False
@@ -1263,13 +1619,12 @@ class JobQueue:
                     logging.warning(f'VPN config not found: {vpn_config_path}')
                     vpn_config_path = None
         
-        wait_ms = settings.get('wait_ms', {}).get(provider, 1000)
-        max_chars_per_request = settings.get('max_chars_per_request', {}).get(provider, 0)
+        wait_ms = (settings.get('wait_ms') or {}).get(provider, 1000)
+        max_chars_per_request = (settings.get('max_chars_per_request') or {}).get(provider, 0)
         
         # Build paths
         abs_path = os.path.join(base_dir, file_path)
-        base_name = os.path.splitext(file_path)[0]
-        ext = os.path.splitext(file_path)[1]
+        base_name, ext = os.path.splitext(file_path)
         output_rel_path = f"{base_name}.{target_lang}{ext}"
         output_abs_path = os.path.join(base_dir, output_rel_path)
         
@@ -1289,7 +1644,7 @@ class JobQueue:
                 if not vpn_started:
                     logging.warning('VPN failed to start, continuing without VPN')
             
-            logging.info(f'Translating {file_path} using local {provider} provider')
+            logging.debug('Translating %s using local %s provider', file_path, provider)
             
             success = translate_srt_file(
                 file_path=abs_path,
@@ -1312,7 +1667,7 @@ class JobQueue:
                 
         except Exception as e:
             error_msg = str(e)
-            logging.error(f'Local translation failed: {error_msg}', exc_info=True)
+            self._log_error_throttled('Local translation failed: %s', e)
             return False, error_msg
         finally:
             # Always stop VPN if it was started
@@ -16,6 +16,11 @@ from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
+import hashlib
+import heapq
+import html
+import threading
 import re
 import concurrent.futures
 
@@ -35,39 +40,237 @@ except ImportError:
     print("pip install Pillow numpy")
     exit(1)
 
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
 
-@dataclass
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# Suppress console windows when spawning tesseract on Windows
+_SUBPROC_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+# Per-worker Tesseract API, created once by _tesserocr_worker_init
+_TESS_API = None
+
+
+# Preprocessed frames with fewer black pixels than this cannot hold readable
+# text, so OCR is skipped for them
+_MIN_INK_PIXELS = 20
+
+# Tesseract's accuracy drops sharply when glyphs render much below ~30px cap
+# height, so preprocessed frames shorter than this get integer-upscaled
+_MIN_TEXT_HEIGHT = 40
+
+
+def _ink_pixels(img: Image.Image) -> int:
+    """Count black (ink) pixels in a preprocessed grayscale image."""
+    return int((np.asarray(img) == 0).sum())
+
+
+def _frame_key(img: Image.Image) -> bytes:
+    """Content hash identifying a frame for OCR deduplication."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{img.mode}:{img.width}x{img.height}'.encode('ascii'))
+    h.update(img.tobytes())
+    return h.digest()
+
+
+def _pgm_bytes(img: Image.Image) -> bytes:
+    """Encode a grayscale image as raw PGM (P5): tiny header plus raw bytes.
+
+    Tesseract reads PGM via Leptonica, and skipping PNG's DEFLATE pass makes
+    the per-image encode essentially free.
+    """
+    arr = np.asarray(img, dtype=np.uint8)
+    header = f'P5\n{arr.shape[1]} {arr.shape[0]}\n255\n'.encode('ascii')
+    return header + arr.tobytes()
+
+
+def _tesserocr_worker_init(language: str, tessdata_path: Optional[str],
+                           psm: int, oem: int) -> None:
+    """Initialize one persistent PyTessBaseAPI in a pool worker."""
+    global _TESS_API
+    # Tesseract parallelizes internally with OpenMP; with several workers
+    # that oversubscribes the CPU, so pin each worker to one thread
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    kwargs = {'lang': language,
+              'psm': tesserocr.PSM(psm),
+              'oem': tesserocr.OEM(oem)}
+    if tessdata_path:
+        kwargs['path'] = tessdata_path
+    _TESS_API = tesserocr.PyTessBaseAPI(**kwargs)
+
+
+def _tesserocr_ocr_one(img: Image.Image) -> str:
+    """OCR one image on the worker's persistent API."""
+    _TESS_API.SetImage(img)
+    return _TESS_API.GetUTF8Text()
+
+
+def _ocr_with_tesserocr(images: List[Image.Image], language: str,
+                        tessdata_path: Optional[str],
+                        worker_count: int) -> Optional[List[str]]:
+    """
+    OCR a batch of preprocessed images on a pool of persistent tesserocr APIs.
+
+    Each worker process loads the language model exactly once, so there is
+    no per-image fork/exec or temp-file round-trip. Returns one text per
+    image in input order, or None when tesserocr is unavailable or the pool
+    fails (caller falls back to subprocess-based OCR).
+    """
+    if tesserocr is None or not images:
+        return None
+
+    texts = [''] * len(images)
+    keep = [i for i, img in enumerate(images) if _ink_pixels(img) >= _MIN_INK_PIXELS]
+    if not keep:
+        return texts
+
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(worker_count, len(keep)),
+                initializer=_tesserocr_worker_init,
+                initargs=(language, tessdata_path, 6, 3)) as executor:
+            results = executor.map(_tesserocr_ocr_one, [images[i] for i in keep], chunksize=8)
+            for i, text in zip(keep, results):
+                texts[i] = text.strip()
+        return texts
+    except Exception as e:
+        print(f"WARNING: tesserocr OCR failed ({e}), falling back to tesseract binary", flush=True)
+        return None
+
+
+def _ocr_batch(ocr: 'TesseractOCR', processed: List[Image.Image], language: str,
+               tessdata_path: Optional[str], worker_count: int) -> Optional[List[str]]:
+    """OCR a batch of preprocessed images, recognizing each distinct frame once.
+
+    Subtitle streams frequently repeat the same bitmap across events (fades,
+    re-displays after cuts), so frames are deduplicated by content hash and
+    the recognized text fanned back out to every occurrence.
+    """
+    keys = [_frame_key(img) for img in processed]
+    order: Dict[bytes, int] = {}
+    unique: List[Image.Image] = []
+    for key, img in zip(keys, processed):
+        if key not in order:
+            order[key] = len(unique)
+            unique.append(img)
+
+    texts = _ocr_with_tesserocr(unique, language, tessdata_path, worker_count)
+    if texts is None:
+        texts = ocr.ocr_images(unique, language)
+    if texts is None:
+        return None
+    return [texts[order[key]] for key in keys]
+
+
+def _scan_rle(data):
+    """Scan a PGS RLE opcode stream into parallel run arrays.
+
+    Returns (rows, xs, counts, colors) int32/uint8 arrays, one entry per
+    run, with coordinates unclipped (the caller clips to the image area).
+    """
+    n = data.shape[0]
+    rows = np.empty(n, dtype=np.int32)
+    xs = np.empty(n, dtype=np.int32)
+    counts = np.empty(n, dtype=np.int32)
+    colors = np.empty(n, dtype=np.uint8)
+    m = 0
+    x = 0
+    y = 0
+    i = 0
+    while i < n:
+        b = int(data[i])
+        i += 1
+        if b != 0:
+            # Single pixel of color b
+            rows[m] = y; xs[m] = x; counts[m] = 1; colors[m] = b
+            m += 1
+            x += 1
+            continue
+        if i >= n:
+            break
+        b2 = int(data[i])
+        i += 1
+        if b2 == 0:
+            # New line
+            x = 0
+            y += 1
+        elif (b2 & 0xC0) == 0x40:
+            # 00 4x xx -> xxx zeros
+            if i < n:
+                count = ((b2 - 0x40) << 8) + int(data[i])
+                i += 1
+                rows[m] = y; xs[m] = x; counts[m] = count; colors[m] = 0
+                m += 1
+                x += count
+        elif (b2 & 0xC0) == 0x80:
+            # 00 8x yy -> x times value y
+            if i < n:
+                count = b2 - 0x80
+                color = int(data[i])
+                i += 1
+                rows[m] = y; xs[m] = x; counts[m] = count; colors[m] = color
+                m += 1
+                x += count
+        elif (b2 & 0xC0) != 0:
+            # 00 cx yy zz -> xyy times value z
+            if i + 1 < n:
+                count = ((b2 - 0xC0) << 8) + int(data[i])
+                i += 1
+                color = int(data[i])
+                i += 1
+                rows[m] = y; xs[m] = x; counts[m] = count; colors[m] = color
+                m += 1
+                x += count
+        else:
+            # 00 xx -> xx times 0
+            rows[m] = y; xs[m] = x; counts[m] = b2; colors[m] = 0
+            m += 1
+            x += b2
+    return rows[:m], xs[:m], counts[:m], colors[:m]
+
+
+try:
+    # Optional: JIT-compile the byte-at-a-time opcode scan. The scanner is
+    # written against plain arrays and scalars so numba can compile it
+    # unchanged; without numba the pure-Python version is used as-is.
+    import numba
+
+    _scan_rle = numba.njit(cache=True)(_scan_rle)
+except ImportError:
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class TimeCode:
-    """Represents a subtitle timecode"""
-    hours: int = 0
-    minutes: int = 0
-    seconds: int = 0
-    milliseconds: int = 0
-    
+    """Represents a subtitle timecode as total milliseconds"""
+    ms: int = 0
+
     @classmethod
     def from_milliseconds(cls, ms: float):
         """Create TimeCode from milliseconds"""
-        total_seconds = int(ms / 1000)
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        milliseconds = int(ms % 1000)
-        return cls(hours, minutes, seconds, milliseconds)
-    
+        return cls(int(ms))
+
     @classmethod
     def from_pts(cls, pts: int):
         """Create TimeCode from PTS timestamp (90kHz clock)"""
-        ms = pts / 90.0
-        return cls.from_milliseconds(ms)
-    
+        return cls(int(pts / 90))
+
     def to_srt_format(self) -> str:
         """Convert to SRT format: HH:MM:SS,mmm"""
-        return f"{self.hours:02d}:{self.minutes:02d}:{self.seconds:02d},{self.milliseconds:03d}"
-    
-    def total_milliseconds(self) -> float:
+        hours, rem = divmod(self.ms, 3600000)
+        minutes, rem = divmod(rem, 60000)
+        seconds, milliseconds = divmod(rem, 1000)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+    def total_milliseconds(self) -> int:
         """Get total milliseconds"""
-        return (self.hours * 3600000 + self.minutes * 60000 + 
-                self.seconds * 1000 + self.milliseconds)
+        return self.ms
 
 
 @dataclass
@@ -85,6 +288,16 @@ class SubtitleEntry:
                 f"{self.text}\n")
 
 
+# Segment header fields after the 'PG' magic: PTS, DTS, type, size
+_SEG_HEADER = struct.Struct('>IIBH')
+
+# Field unpackers compiled once instead of re-parsing '>H'/'>HH' per call
+_U16 = struct.Struct('>H')
+_PCS_HEAD = struct.Struct('>HHBH')        # width, height, frame rate, composition number
+_PCS_OBJ = struct.Struct('>HBBHH')        # object id, window id, flags, x, y
+_ODS_DIMS = struct.Struct('>HH')          # width, height
+
+
 class BluRaySupParser:
     """Parser for Blu-ray SUP files"""
     
@@ -102,66 +315,71 @@ class BluRaySupParser:
         """Parse SUP file and extract subtitle data with proper end times"""
         subtitles = []
         current_subtitle = None
-        
+
+        # Read the whole file once and walk it with a cursor; the previous
+        # 13-byte read() per segment paid a syscall for every header
         with open(self.filepath, 'rb') as f:
-            while True:
-                # Read segment header (13 bytes)
-                header = f.read(13)
-                if len(header) < 13:
-                    break
-                
-                # Check for PG magic bytes
-                if header[0] != 0x50 or header[1] != 0x47:  # 'PG'
-                    break
-                
-                # Parse header
-                pts = struct.unpack('>I', header[2:6])[0]
-                dts = struct.unpack('>I', header[6:10])[0]
-                segment_type = header[10]
-                segment_size = struct.unpack('>H', header[11:13])[0]
-                
-                # Read segment data
-                segment_data = f.read(segment_size)
-                if len(segment_data) < segment_size:
-                    break
-                
-                # Process PCS (Picture Control Segment)
-                if segment_type == self.SEGMENT_TYPE_PCS:
-                    pcs_data = self._parse_pcs(segment_data, pts)
-                    if pcs_data:
-                        # Check if this is a "clear" segment (no objects = end previous subtitle)
-                        if pcs_data['num_objects'] == 0 and current_subtitle:
-                            # This PCS clears the screen - set end time for previous subtitle
-                            current_subtitle['end_pts'] = pts
-                            current_subtitle = None
-                        elif pcs_data['num_objects'] > 0:
-                            # New subtitle with objects - start collecting segments
-                            current_subtitle = {
-                                'pcs': pcs_data,
-                                'palettes': [],
-                                'objects': [],
-                                'start_pts': pts,
-                                'end_pts': None  # Will be set when we find the clear segment
-                            }
-                            subtitles.append(current_subtitle)
-                
-                # Process PDS (Palette Definition Segment)
-                elif segment_type == self.SEGMENT_TYPE_PDS and current_subtitle:
-                    palette = self._parse_pds(segment_data)
-                    current_subtitle['palettes'].append(palette)
-                
-                # Process ODS (Object Definition Segment)
-                elif segment_type == self.SEGMENT_TYPE_ODS and current_subtitle:
-                    obj_data = self._parse_ods(segment_data)
-                    if obj_data:
-                        if obj_data.get('is_first'):
-                            # First fragment - add as new object
-                            current_subtitle['objects'].append(obj_data)
-                        elif not obj_data.get('is_first') and current_subtitle['objects']:
-                            # Continuation fragment - append data to last object
-                            last_obj = current_subtitle['objects'][-1]
-                            if 'data' in last_obj and 'data' in obj_data:
-                                last_obj['data'] += obj_data['data']
+            buf = f.read()
+        view = memoryview(buf)
+
+        pos = 0
+        end = len(buf)
+        while True:
+            # Segment header is 13 bytes
+            if pos + 13 > end:
+                break
+
+            # Check for PG magic bytes
+            if buf[pos] != 0x50 or buf[pos + 1] != 0x47:  # 'PG'
+                break
+
+            # Parse header
+            pts, dts, segment_type, segment_size = _SEG_HEADER.unpack_from(buf, pos + 2)
+
+            # Slice segment data out of the buffer (no copy)
+            data_start = pos + 13
+            if data_start + segment_size > end:
+                break
+            segment_data = view[data_start:data_start + segment_size]
+            pos = data_start + segment_size
+
+            # Process PCS (Picture Control Segment)
+            if segment_type == self.SEGMENT_TYPE_PCS:
+                pcs_data = self._parse_pcs(segment_data, pts)
+                if pcs_data:
+                    # Check if this is a "clear" segment (no objects = end previous subtitle)
+                    if pcs_data['num_objects'] == 0 and current_subtitle:
+                        # This PCS clears the screen - set end time for previous subtitle
+                        current_subtitle['end_pts'] = pts
+                        current_subtitle = None
+                    elif pcs_data['num_objects'] > 0:
+                        # New subtitle with objects - start collecting segments
+                        current_subtitle = {
+                            'pcs': pcs_data,
+                            'palettes': [],
+                            'objects': [],
+                            'start_pts': pts,
+                            'end_pts': None  # Will be set when we find the clear segment
+                        }
+                        subtitles.append(current_subtitle)
+            
+            # Process PDS (Palette Definition Segment)
+            elif segment_type == self.SEGMENT_TYPE_PDS and current_subtitle:
+                palette = self._parse_pds(segment_data)
+                current_subtitle['palettes'].append(palette)
+            
+            # Process ODS (Object Definition Segment)
+            elif segment_type == self.SEGMENT_TYPE_ODS and current_subtitle:
+                obj_data = self._parse_ods(segment_data)
+                if obj_data:
+                    if obj_data.get('is_first'):
+                        # First fragment - add as new object
+                        current_subtitle['objects'].append(obj_data)
+                    elif not obj_data.get('is_first') and current_subtitle['objects']:
+                        # Continuation fragment - append data to last object
+                        last_obj = current_subtitle['objects'][-1]
+                        if 'data' in last_obj and 'data' in obj_data:
+                            last_obj['data'].extend(obj_data['data'])
         
         return subtitles
     
@@ -170,24 +388,17 @@ class BluRaySupParser:
         if len(data) < 11:
             return None
         
-        width = struct.unpack('>H', data[0:2])[0]
-        height = struct.unpack('>H', data[2:4])[0]
-        frame_rate = data[4]
-        comp_num = struct.unpack('>H', data[5:7])[0]
+        width, height, frame_rate, comp_num = _PCS_HEAD.unpack_from(data, 0)
         comp_state = data[7]
         palette_update = data[8] == 0x80
         palette_id = data[9]
         num_objects = data[10]
-        
+
         objects = []
         offset = 11
         for i in range(num_objects):
             if offset + 8 <= len(data):
-                obj_id = struct.unpack('>H', data[offset:offset+2])[0]
-                window_id = data[offset+2]
-                flags = data[offset+3]
-                x = struct.unpack('>H', data[offset+4:offset+6])[0]
-                y = struct.unpack('>H', data[offset+6:offset+8])[0]
+                obj_id, window_id, flags, x, y = _PCS_OBJ.unpack_from(data, offset)
                 objects.append({'id': obj_id, 'x': x, 'y': y})
                 offset += 8
         
@@ -201,60 +412,59 @@ class BluRaySupParser:
             'pts': pts
         }
     
-    def _parse_pds(self, data: bytes) -> Dict:
-        """Parse Palette Definition Segment"""
+    def _parse_pds(self, data: bytes) -> np.ndarray:
+        """Parse Palette Definition Segment into a (256, 4) RGBA lookup table"""
         palette_id = data[0]
         palette_version = data[1]
-        
+
+        lut = np.zeros((256, 4), dtype=np.uint8)
+
         # Each palette entry is 5 bytes: index, Y, Cr, Cb, Alpha
         num_entries = (len(data) - 2) // 5
-        palette = {}
-        
-        for i in range(num_entries):
-            offset = 2 + i * 5
-            idx = data[offset]
-            y = data[offset + 1]
-            cr = data[offset + 2]
-            cb = data[offset + 3]
-            alpha = data[offset + 4]
-            
-            # Convert YCbCr to RGB using BT.709 standard (same as SubtitleEdit)
-            # BT.709 for YCbCr 16..235 -> RGB 0..255 (PC)
-            y_adj = y - 16
-            cb_adj = cb - 128
-            cr_adj = cr - 128
-            
-            y1 = y_adj * 1.164383562
-            r = y1 + cr_adj * 1.792741071
-            g = y1 - cr_adj * 0.5329093286 - cb_adj * 0.2132486143
-            b = y1 + cb_adj * 2.112401786
-            
-            # Clamp to 0-255 range
-            r = max(0, min(255, int(r + 0.5)))
-            g = max(0, min(255, int(g + 0.5)))
-            b = max(0, min(255, int(b + 0.5)))
-            
-            palette[idx] = (r, g, b, alpha)
-        
-        return palette
+        if num_entries <= 0:
+            return lut
+
+        entries = np.frombuffer(data, np.uint8, count=num_entries * 5, offset=2)
+        entries = entries.reshape(-1, 5)
+        arr = entries.astype(np.float64)
+
+        # Convert YCbCr to RGB using BT.709 standard (same as SubtitleEdit)
+        # BT.709 for YCbCr 16..235 -> RGB 0..255 (PC), vectorized over all
+        # palette entries at once
+        y1 = (arr[:, 1] - 16) * 1.164383562
+        cr = arr[:, 2] - 128
+        cb = arr[:, 3] - 128
+        r = y1 + cr * 1.792741071
+        g = y1 - cr * 0.5329093286 - cb * 0.2132486143
+        b = y1 + cb * 2.112401786
+
+        # Round and clamp to 0-255 range
+        rgb = np.stack([r, g, b], axis=1)
+        rgb = np.clip(np.floor(rgb + 0.5), 0, 255).astype(np.uint8)
+
+        lut[entries[:, 0], :3] = rgb
+        lut[entries[:, 0], 3] = entries[:, 4]
+        return lut
     
     def _parse_ods(self, data: bytes) -> Optional[Dict]:
         """Parse Object Definition Segment"""
         if len(data) < 4:
             return None
         
-        obj_id = struct.unpack('>H', data[0:2])[0]
+        obj_id = _U16.unpack_from(data, 0)[0]
         obj_version = data[2]
         sequence = data[3]
-        
+
         is_first = (sequence & 0x80) == 0x80
         is_last = (sequence & 0x40) == 0x40
-        
+
         if is_first and len(data) >= 11:
-            width = struct.unpack('>H', data[7:9])[0]
-            height = struct.unpack('>H', data[9:11])[0]
-            image_data = data[11:]
-            
+            width, height = _ODS_DIMS.unpack_from(data, 7)
+            # Materialize the pixel data; the segment itself is a view into
+            # the file buffer, and a bytearray lets continuation fragments
+            # extend in place instead of reallocating on every concat
+            image_data = bytearray(data[11:])
+
             return {
                 'id': obj_id,
                 'width': width,
@@ -266,91 +476,88 @@ class BluRaySupParser:
             # Fragment - append to previous
             return {
                 'id': obj_id,
-                'data': data[4:],
+                'data': bytes(data[4:]),
                 'is_first': False
             }
         
         return None
     
-    def decode_image(self, obj_data: Dict, palette: Dict) -> Optional[Image.Image]:
-        """Decode RLE-compressed image data"""
+    def decode_image(self, obj_data: Dict, palette_lut: np.ndarray) -> Optional[Image.Image]:
+        """Decode RLE-compressed image data using a (256, 4) RGBA palette LUT"""
         if not obj_data or 'width' not in obj_data:
             return None
-        
+
         width = obj_data['width']
         height = obj_data['height']
         data = obj_data['data']
-        
+
         if width <= 0 or height <= 0:
             return None
-        
-        # Create RGBA image
-        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        pixels = img.load()
-        
-        x, y = 0, 0
-        i = 0
-        
-        while i < len(data) and y < height:
-            b = data[i]
-            i += 1
-            
-            if b == 0 and i < len(data):
-                b2 = data[i]
-                i += 1
-                
-                if b2 == 0:
-                    # New line
-                    x = 0
-                    y += 1
-                elif (b2 & 0xC0) == 0x40:
-                    # 00 4x xx -> xxx zeros
-                    if i < len(data):
-                        count = ((b2 - 0x40) << 8) + data[i]
-                        i += 1
-                        color = palette.get(0, (0, 0, 0, 0))
-                        for _ in range(count):
-                            if x < width and y < height:
-                                pixels[x, y] = color
-                            x += 1
-                elif (b2 & 0xC0) == 0x80:
-                    # 00 8x yy -> x times value y
-                    count = b2 - 0x80
-                    if i < len(data):
-                        color_idx = data[i]
-                        i += 1
-                        color = palette.get(color_idx, (0, 0, 0, 0))
-                        for _ in range(count):
-                            if x < width and y < height:
-                                pixels[x, y] = color
-                            x += 1
-                elif (b2 & 0xC0) != 0:
-                    # 00 cx yy zz -> xyy times value z
-                    if i + 1 < len(data):
-                        count = ((b2 - 0xC0) << 8) + data[i]
-                        i += 1
-                        color_idx = data[i]
-                        i += 1
-                        color = palette.get(color_idx, (0, 0, 0, 0))
-                        for _ in range(count):
-                            if x < width and y < height:
-                                pixels[x, y] = color
-                            x += 1
-                else:
-                    # 00 xx -> xx times 0
-                    color = palette.get(0, (0, 0, 0, 0))
-                    for _ in range(b2):
-                        if x < width and y < height:
-                            pixels[x, y] = color
-                        x += 1
-            else:
-                # Single pixel
-                color = palette.get(b, (0, 0, 0, 0))
-                if x < width and y < height:
-                    pixels[x, y] = color
-                x += 1
-        
-        return img
+
+        # Scan the opcode stream into parallel run arrays, then expand the
+        # runs and look the colors up with NumPy. This replaces the previous
+        # per-pixel Python loop with C-level np.repeat/fancy indexing.
+        rows, xs, counts, colors = _scan_rle(np.frombuffer(bytes(data), dtype=np.uint8))
+
+        flat = np.zeros(height * width, dtype=np.uint8)
+        if rows.size:
+            rows = rows.astype(np.int64)
+            xs = xs.astype(np.int64)
+            counts = counts.astype(np.int64)
+            # Clip runs to the visible area; streams may run past the row end
+            keep = (rows < height) & (xs < width) & (counts > 0)
+            rows, xs, counts, colors = rows[keep], xs[keep], counts[keep], colors[keep]
+            counts = np.minimum(counts, width - xs)
+            total = int(counts.sum())
+            if total:
+                starts = rows * width + xs
+                run_offsets = np.cumsum(counts) - counts
+                out_idx = (np.arange(total, dtype=np.int64)
+                           - np.repeat(run_offsets, counts)
+                           + np.repeat(starts, counts))
+                flat[out_idx] = np.repeat(colors, counts)
+
+        rgba = palette_lut[flat]
+
+        # Fully transparent frames render nothing; skip them outright
+        if not rgba[:, 3].any():
+            return None
+
+        return Image.fromarray(rgba.reshape(height, width, 4), 'RGBA')
+
+@lru_cache(maxsize=1)
+def _discover_tesseract() -> str:
+    """Find the tesseract executable, probing the filesystem only once."""
+    # Check if running on Windows or Linux
+    if os.name == 'nt':
+        # Windows paths
+        common_paths = [
+            r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+            r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+            "tesseract.exe"
+        ]
+    else:
+        # Linux/Unix paths
+        common_paths = [
+            "/usr/bin/tesseract",
+            "/usr/local/bin/tesseract",
+            "/opt/tesseract/bin/tesseract"
+        ]
+
+    for path in common_paths:
+        if os.path.exists(path):
+            return path
+
+    # Try to find in PATH
+    return "tesseract"
+
+
+# hOCR parsing patterns, compiled once (both quote styles occur in the wild)
+_HOCR_LINE_RE = re.compile(r'<span class=["\']ocr_line["\'][^>]*>(.*?)</span>', re.DOTALL)
+_HOCR_WORD_RE = re.compile(r'<span class=["\']ocrx_word["\'][^>]*>(.*?)</span>', re.DOTALL)
+_HOCR_SPAN_RE = re.compile(r'<span[^>]*>(.*?)</span>', re.DOTALL)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
 class TesseractOCR:
     """Wrapper for Tesseract OCR"""
@@ -367,35 +574,10 @@ class TesseractOCR:
             self.tesseract_cmd = tesseract_path
         else:
             # Try to find tesseract in common locations
-            self.tesseract_cmd = self._find_tesseract()
-        
+            self.tesseract_cmd = _discover_tesseract()
+
         self.tessdata_path = tessdata_path
-        
-    def _find_tesseract(self) -> str:
-        """Find tesseract executable"""
-        # Check if running on Windows or Linux
-        if os.name == 'nt':
-            # Windows paths
-            common_paths = [
-                r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-                r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-                "tesseract.exe"
-            ]
-        else:
-            # Linux/Unix paths
-            common_paths = [
-                "/usr/bin/tesseract",
-                "/usr/local/bin/tesseract",
-                "/opt/tesseract/bin/tesseract"
-            ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-        
-        # Try to find in PATH
-        return "tesseract"
-    
+
     def preprocess_image(self, img: Image.Image) -> Image.Image:
         """
         Preprocess image:
@@ -409,28 +591,25 @@ class TesseractOCR:
             img = img.convert('RGBA')
         
         # Convert to numpy array
-        img_array = np.array(img)
-        
-        # Extract channels
-        r = img_array[:, :, 0]
-        g = img_array[:, :, 1]
-        b = img_array[:, :, 2]
-        alpha = img_array[:, :, 3]
-        
-        # Convert black pixels (R=0, G=0, B=0) to transparent
-        is_black = (r == 0) & (g == 0) & (b == 0)
-        alpha = np.where(is_black, 0, alpha)
-        
-        # Create output: if alpha > 0 (not transparent) → 0 (black), else → 255 (white)
-        output = np.where(alpha > 0, 0, 255).astype(np.uint8)
-        
-        # Convert to PIL Image (grayscale)
-        img_processed = Image.fromarray(output, mode='L')
-        
-        # Add white margin
-        img_processed = self._add_margin(img_processed, 10)
-        
-        return img_processed
+        img_array = np.asarray(img)
+
+        # A pixel stays (black) only if it is opaque and not pure black;
+        # everything else (transparent or black source pixels) becomes white.
+        keep = (img_array[:, :, 3] != 0) & img_array[:, :, :3].any(axis=2)
+        output = np.where(keep, np.uint8(0), np.uint8(255))
+
+        # Crop to the ink bounding box so Tesseract does not scan empty
+        # borders, then integer-upscale frames whose text renders too small
+        rows = np.flatnonzero(keep.any(axis=1))
+        if rows.size:
+            cols = np.flatnonzero(keep.any(axis=0))
+            output = output[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+            if output.shape[0] < _MIN_TEXT_HEIGHT:
+                factor = min(4, -(-_MIN_TEXT_HEIGHT // output.shape[0]))
+                output = output.repeat(factor, axis=0).repeat(factor, axis=1)
+
+        # Add white margin and convert to a grayscale PIL image
+        return self._add_margin(output, 10)
     
     def _crop_transparent(self, img: Image.Image) -> Image.Image:
         """Crop transparent areas from image"""
@@ -446,25 +625,15 @@ class TesseractOCR:
             return img.crop(bbox)
         return img
     
-    def _add_margin(self, img: Image.Image, margin: int) -> Image.Image:
-        """Add white margin around image"""
-        new_width = img.width + 2 * margin
-        new_height = img.height + 2 * margin
-        
-        # Create image with white margin
-        new_img = Image.new('L', (new_width, new_height), 255)  # White background
-        
-        # Convert input to grayscale if needed
-        if img.mode == 'RGBA':
-            # Convert RGBA to L (grayscale)
-            img_gray = img.convert('L')
-        else:
-            img_gray = img
-        
-        # Paste the grayscale image onto white background
-        new_img.paste(img_gray, (margin, margin))
-        
-        return new_img
+    def _add_margin(self, arr: np.ndarray, margin: int) -> Image.Image:
+        """Add white margin around a grayscale image array"""
+        height, width = arr.shape
+
+        # Single allocation plus one slice write instead of PIL paste
+        out = np.full((height + 2 * margin, width + 2 * margin), 255, np.uint8)
+        out[margin:margin + height, margin:margin + width] = arr
+
+        return Image.fromarray(out, mode='L')
     
     def ocr_image(self, img: Image.Image, language: str = 'eng', 
                   psm: int = 6, oem: int = 3, debug_save_path: str = None) -> str:
@@ -481,133 +650,185 @@ class TesseractOCR:
         Returns:
             Extracted text
         """
-        # Preprocess image
-        img_processed = self.preprocess_image(img)
-        
+        return self.ocr_preprocessed(self.preprocess_image(img), language, psm, oem, debug_save_path)
+
+    def ocr_preprocessed(self, img_processed: Image.Image, language: str = 'eng',
+                         psm: int = 6, oem: int = 3, debug_save_path: str = None) -> str:
+        """Recognize a frame that has already been through preprocess_image.
+
+        Splitting recognition from preprocessing lets callers preprocess on
+        the submitting thread and keep the Tesseract workers saturated.
+        """
         # Save preprocessed image for debugging
         if debug_save_path:
             img_processed.save(debug_save_path)
             print(f"Saved preprocessed image: {debug_save_path}")
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_img:
-            img_processed.save(tmp_img.name, 'PNG')
-            tmp_img_path = tmp_img.name
-        
-        try:
-            # Run Tesseract
-            text = self._run_tesseract(tmp_img_path, language, psm, oem, debug_save_path)
-            return text.strip()
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(tmp_img_path)
-            except:
-                pass
+
+        # Nothing worth recognizing on an (almost) blank frame
+        if _ink_pixels(img_processed) < _MIN_INK_PIXELS:
+            return ""
+
+        # Encode in memory and pipe to Tesseract; no temp files involved
+        text = self._run_tesseract(_pgm_bytes(img_processed), language, psm, oem, debug_save_path)
+        return text.strip()
     
-    def _run_tesseract(self, image_path: str, language: str, 
-                       psm: int, oem: int, debug_save_path: str = None) -> str:
-        """Run Tesseract command and get plain text output"""
-        with tempfile.NamedTemporaryFile(suffix='', delete=False) as tmp_out:
-            output_base = tmp_out.name
-        
-        try:
-            # Build command for plain text output
-            cmd = [self.tesseract_cmd, image_path, output_base, '-l', language]
-            
+    def ocr_images(self, images: List[Image.Image], language: str = 'eng',
+                   psm: int = 6, oem: int = 3) -> Optional[List[str]]:
+        """
+        OCR a batch of preprocessed images with a single Tesseract invocation.
+
+        Tesseract accepts a text file listing one image path per line and
+        emits the recognized pages separated by form-feed, so one process
+        (and one model load) covers the whole batch instead of one process
+        per subtitle.
+
+        Returns one text per image in input order, or None if the batch run
+        failed or the output could not be mapped back (caller should fall
+        back to per-image OCR).
+        """
+        if not images:
+            return []
+
+        # Blank frames get '' without ever reaching Tesseract
+        texts = [''] * len(images)
+        keep = [i for i, img in enumerate(images) if _ink_pixels(img) >= _MIN_INK_PIXELS]
+        if not keep:
+            return texts
+
+        with tempfile.TemporaryDirectory(prefix='ocr_batch_') as tmp_dir:
+            image_paths = []
+            for i in keep:
+                image_path = os.path.join(tmp_dir, f'{i:06d}.pgm')
+                with open(image_path, 'wb') as img_file:
+                    img_file.write(_pgm_bytes(images[i]))
+                image_paths.append(image_path)
+
+            list_path = os.path.join(tmp_dir, 'images.txt')
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(image_paths))
+
+            output_base = os.path.join(tmp_dir, 'out')
+            cmd = [self.tesseract_cmd, list_path, output_base, '-l', language]
+
             if self.tessdata_path:
                 cmd.insert(1, '--tessdata-dir')
                 cmd.insert(2, self.tessdata_path)
-            
+
             cmd.extend(['--psm', str(psm)])
             cmd.extend(['--oem', str(oem)])
-            
-            # Debug: print command for first few
-            if debug_save_path:
-                print(f"Tesseract command: {' '.join(cmd)}")
-            
-            # Run Tesseract
-            timeout_seconds = _get_tesseract_timeout_seconds()
-            result = subprocess.run(cmd, capture_output=True, text=True, 
-                                   timeout=timeout_seconds, creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0)
-            
-            if debug_save_path and result.stderr:
-                print(f"Tesseract stderr: {result.stderr}")
-            
-            # Read text output
+            cmd.extend(['-c', 'page_separator=\f'])
+
+            # Scale the per-image timeout with the batch size
+            timeout_seconds = _get_tesseract_timeout_seconds() * len(keep)
+            try:
+                subprocess.run(cmd, capture_output=True, text=True,
+                               timeout=timeout_seconds, creationflags=_SUBPROC_FLAGS)
+            except (subprocess.TimeoutExpired, OSError):
+                return None
+
             txt_path = output_base + '.txt'
-            
-            if os.path.exists(txt_path):
-                with open(txt_path, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                
-                if debug_save_path:
-                    print(f"OCR text output: '{text.strip()}'")
-                
-                return text.strip()
-            
-            return ""
-        
-        finally:
-            # Clean up temp files
-            for ext in ['', '.txt']:
-                try:
-                    os.unlink(output_base + ext)
-                except:
-                    pass
+            if not os.path.exists(txt_path):
+                return None
+
+            with open(txt_path, 'r', encoding='utf-8') as f:
+                pages = f.read().split('\f')
+
+        # Tesseract appends the separator after the last page too
+        if len(pages) == len(keep) + 1 and not pages[-1].strip():
+            pages.pop()
+
+        if len(pages) != len(keep):
+            return None
+
+        for i, page in zip(keep, pages):
+            texts[i] = page.strip()
+        return texts
+
+    def _run_tesseract(self, image_bytes: bytes, language: str,
+                       psm: int, oem: int, debug_save_path: str = None) -> str:
+        """Run Tesseract with the image on stdin and plain text on stdout"""
+        # '-' reads the image from stdin, 'stdout' writes text to stdout, so
+        # neither side touches the disk
+        cmd = [self.tesseract_cmd, '-', 'stdout', '-l', language]
+
+        if self.tessdata_path:
+            cmd.insert(1, '--tessdata-dir')
+            cmd.insert(2, self.tessdata_path)
+
+        cmd.extend(['--psm', str(psm)])
+        cmd.extend(['--oem', str(oem)])
+
+        # Debug: print command for first few
+        if debug_save_path:
+            print(f"Tesseract command: {' '.join(cmd)}")
+
+        # Run Tesseract
+        timeout_seconds = _get_tesseract_timeout_seconds()
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE,
+                                creationflags=_SUBPROC_FLAGS)
+        try:
+            out, err = proc.communicate(image_bytes, timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+
+        if debug_save_path and err:
+            print(f"Tesseract stderr: {err.decode('utf-8', errors='replace')}")
+
+        text = out.decode('utf-8', errors='replace')
+
+        if debug_save_path:
+            print(f"OCR text output: '{text.strip()}'")
+
+        return text.strip()
     
     def _parse_hocr(self, hocr: str) -> str:
         """Parse HOCR HTML output to extract text"""
         lines = []
         
-        # Find all ocr_line spans (handle both single and double quotes)
-        line_pattern = r'<span class=["\']ocr_line["\'][^>]*>(.*?)</span>'
-        line_matches = re.finditer(line_pattern, hocr, re.DOTALL)
-        
-        for line_match in line_matches:
+        for line_match in _HOCR_LINE_RE.finditer(hocr):
             line_content = line_match.group(1)
-            
-            # Find all ocrx_word spans within this line (handle both quote styles)
-            word_pattern = r'<span class=["\']ocrx_word["\'][^>]*>(.*?)</span>'
-            word_matches = re.finditer(word_pattern, line_content, re.DOTALL)
-            
+
             words = []
-            for word_match in word_matches:
+            for word_match in _HOCR_WORD_RE.finditer(line_content):
                 word_text = word_match.group(1)
                 # Remove any remaining HTML tags
-                word_text = re.sub(r'<[^>]+>', '', word_text)
+                word_text = _HTML_TAG_RE.sub('', word_text)
                 # Handle HTML entities
-                word_text = word_text.replace('&amp;', '&')
-                word_text = word_text.replace('&lt;', '<')
-                word_text = word_text.replace('&gt;', '>')
-                word_text = word_text.replace('&quot;', '"')
-                word_text = word_text.replace('&#39;', "'")
-                word_text = word_text.replace('&apos;', "'")
+                word_text = html.unescape(word_text)
                 # Handle italics
                 word_text = word_text.replace('<em>', '<i>').replace('</em>', '</i>')
                 word_text = word_text.replace('<strong>', '').replace('</strong>', '')
-                
+
                 if word_text.strip():
                     words.append(word_text.strip())
-            
+
             if words:
                 lines.append(' '.join(words))
-        
+
         # If no lines found with the pattern above, try alternative parsing
         if not lines:
             # Try to find any text content in span elements
-            all_spans = re.finditer(r'<span[^>]*>(.*?)</span>', hocr, re.DOTALL)
-            for span in all_spans:
+            for span in _HOCR_SPAN_RE.finditer(hocr):
                 text = span.group(1)
                 # Skip if it contains other HTML tags (nested spans)
                 if '<span' not in text:
-                    text = re.sub(r'<[^>]+>', '', text).strip()
+                    text = _HTML_TAG_RE.sub('', text).strip()
                     if text and len(text) > 0:
                         lines.append(text)
         
         return '\n'.join(lines)
 
 
+def _decode_one(payload: Tuple[Dict, np.ndarray]) -> Optional[Image.Image]:
+    """Decode one subtitle image; top-level so pool workers can pickle it."""
+    obj, palette_lut = payload
+    # decode_image never touches instance state, so no parser object is needed
+    return BluRaySupParser.decode_image(None, obj, palette_lut)
+
+
 def _get_ocr_worker_count() -> int:
     env = os.getenv('OCR_WORKERS')
     if env:
@@ -626,6 +847,21 @@ def _print_progress(message: str) -> None:
         print(message, flush=True)
 
 
+def _progress_iter(iterable, total: int, desc: str):
+    """Iterate with a rate-limited tqdm bar, or coarse prints without tqdm.
+
+    tqdm redraws at most every 0.1s regardless of item rate, so progress
+    reporting stays cheap even when items complete in microseconds.
+    """
+    if tqdm is not None:
+        yield from tqdm(iterable, total=total, desc=desc, unit='sub', mininterval=0.1)
+        return
+    for i, item in enumerate(iterable, 1):
+        if i == 1 or i % 25 == 0 or i == total:
+            _print_progress(f"{desc} {i}/{total}...")
+        yield item
+
+
 def _get_tesseract_timeout_seconds() -> int:
     env = os.getenv('TESSERACT_TIMEOUT_SECONDS')
     if env:
@@ -671,107 +907,188 @@ def convert_sup_to_srt(sup_path: str, output_path: str, language: str = 'eng',
     worker_count = _get_ocr_worker_count()
     print(f"OCR workers: {worker_count}")
 
-    def _ocr_one_sup(i: int, img: Image.Image, debug_path: Optional[str]) -> Tuple[int, str]:
-        ocr = TesseractOCR(tesseract_path, tessdata_path)
-        text = ocr.ocr_image(img, language, debug_save_path=debug_path)
-        return i, text
+    # One shared instance; TesseractOCR holds no per-image state, so reusing
+    # it across threads is safe and skips repeated executable discovery
+    ocr = TesseractOCR(tesseract_path, tessdata_path)
 
-    pending: List[Tuple[int, Dict, Image.Image, Optional[str]]] = []
-    for idx, sub in enumerate(subtitles, 1):
-        if idx == 1 or idx % 25 == 0:
-            _print_progress(f"Decoding subtitle images {idx}/{len(subtitles)}...")
+    # Repeated frames only hit Tesseract once in the per-image fallback too
+    ocr_cache: Dict[bytes, str] = {}
+    ocr_cache_lock = threading.Lock()
 
-        # Get palette (use last one if multiple)
-        palette = sub['palettes'][-1] if sub['palettes'] else {}
+    def _ocr_one_sup(i: int, img_processed: Image.Image, debug_path: Optional[str]) -> Tuple[int, str]:
+        if debug_path is not None:
+            # Debug runs want the per-frame side effects, so skip the cache
+            return i, ocr.ocr_preprocessed(img_processed, language, debug_save_path=debug_path)
+        key = _frame_key(img_processed)
+        with ocr_cache_lock:
+            text = ocr_cache.get(key)
+        if text is None:
+            text = ocr.ocr_preprocessed(img_processed, language)
+            with ocr_cache_lock:
+                ocr_cache[key] = text
+        return i, text
 
+    decode_jobs: List[Tuple[int, Dict]] = []
+    payloads: List[Tuple[Dict, np.ndarray]] = []
+    for idx, sub in enumerate(subtitles, 1):
         # Get first object (main subtitle image)
         if not sub['objects']:
             continue
 
-        obj = sub['objects'][0]
+        # Get palette LUT (use last one if multiple)
+        if sub['palettes']:
+            palette = sub['palettes'][-1]
+        else:
+            palette = np.zeros((256, 4), dtype=np.uint8)
+
+        decode_jobs.append((idx, sub))
+        payloads.append((sub['objects'][0], palette))
+
+    if worker_count > 1 and len(decode_jobs) >= 64:
+        # Each decode is independent and CPU-bound, so fan out across
+        # processes; chunked map keeps the pickling overhead per task low
+        decode_workers = max(1, min(worker_count, os.cpu_count() or 1))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=decode_workers) as executor:
+            images = list(_progress_iter(executor.map(_decode_one, payloads, chunksize=16),
+                                         len(payloads), "Decoding"))
+    else:
+        images = list(_progress_iter(map(_decode_one, payloads), len(payloads), "Decoding"))
+
+    # Debug PNG writes go through a single background thread so disk I/O
+    # does not serialize the collection loop
+    debug_io = concurrent.futures.ThreadPoolExecutor(max_workers=1) if debug_mode else None
+
+    def _sup_times(sub: Dict) -> Tuple[TimeCode, TimeCode]:
+        start_time = TimeCode.from_pts(sub['start_pts'])
+        if sub.get('end_pts'):
+            end_time = TimeCode.from_pts(sub['end_pts'])
+        else:
+            end_time = TimeCode.from_milliseconds(start_time.total_milliseconds() + 3000)
+        return start_time, end_time
 
-        # Decode image (do this in main thread)
-        img = parser.decode_image(obj, palette)
+    # TimeCodes are resolved here so pending holds no references to the
+    # parsed subtitle dicts; dropping those (and the decode payloads) below
+    # lets the RLE buffers be reclaimed while OCR runs
+    pending: List[Tuple[int, TimeCode, TimeCode, Image.Image, Optional[str]]] = []
+    for (idx, sub), img in zip(decode_jobs, images):
         if not img:
             continue
 
         debug_path = None
         if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
             original_debug_path = f"debug_sub{idx}_original.png"
-            img.save(original_debug_path)
-            print(f"\n[DEBUG] Saved original image: {original_debug_path}")
+            debug_io.submit(img.copy().save, original_debug_path)
+            print(f"\n[DEBUG] Saving original image: {original_debug_path}")
             debug_path = f"debug_sub{idx}_preprocessed.png"
 
-        pending.append((idx, sub, img, debug_path))
+        start_tc, end_tc = _sup_times(sub)
+        pending.append((idx, start_tc, end_tc, img, debug_path))
+
+    del subtitles, decode_jobs, payloads, images
 
     if not sys.stdout.isatty():
         print(f"Decoded {len(pending)} subtitle images", flush=True)
 
-    srt_entries = []
-    if worker_count <= 1 or len(pending) <= 1:
-        for idx, sub, img, debug_path in pending:
-            _print_progress(f"OCR subtitle {idx}/{len(pending)}...")
-            _, text = _ocr_one_sup(idx, img, debug_path)
-            if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
-                if debug_path:
-                    print(f"[DEBUG] Saved preprocessed image: {debug_path}")
-                print(f"[DEBUG] OCR result for subtitle {idx}: '{text}'")
-
-            if text:
-                start_time = TimeCode.from_pts(sub['start_pts'])
-                if sub.get('end_pts'):
-                    end_time = TimeCode.from_pts(sub['end_pts'])
-                else:
-                    end_time = TimeCode.from_milliseconds(start_time.total_milliseconds() + 3000)
-                srt_entries.append({'start_time': start_time, 'end_time': end_time, 'text': text, 'original_index': idx})
-    else:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=worker_count) as executor:
-            future_to_item: Dict[concurrent.futures.Future, Tuple[int, Dict, Optional[str]]] = {}
-            for idx, sub, img, debug_path in pending:
-                future = executor.submit(_ocr_one_sup, idx, img, debug_path)
-                future_to_item[future] = (idx, sub, debug_path)
-
-            done_count = 0
-            for future in concurrent.futures.as_completed(future_to_item):
-                idx, sub, debug_path = future_to_item[future]
-                done_count += 1
-                _print_progress(f"OCR subtitle {done_count}/{len(pending)}...")
-                try:
-                    _, text = future.result()
-                except Exception as e:
-                    print(f"\nERROR: OCR failed for subtitle {idx}: {e}", flush=True)
-                    continue
-
-                if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
-                    if debug_path:
-                        print(f"[DEBUG] Saved preprocessed image: {debug_path}")
-                    print(f"[DEBUG] OCR result for subtitle {idx}: '{text}'")
-
-                if text:
-                    start_time = TimeCode.from_pts(sub['start_pts'])
-                    if sub.get('end_pts'):
-                        end_time = TimeCode.from_pts(sub['end_pts'])
-                    else:
-                        end_time = TimeCode.from_milliseconds(start_time.total_milliseconds() + 3000)
-                    srt_entries.append({'start_time': start_time, 'end_time': end_time, 'text': text, 'original_index': idx})
-
-        srt_entries.sort(key=lambda x: x.get('original_index', 0))
-    
-    print(f"\nProcessed {len(srt_entries)} subtitles with text")
-    
-    # Write SRT file with sequential numbering
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for srt_idx, entry in enumerate(srt_entries, 1):
-            # Create SubtitleEntry and write to file
-            subtitle_entry = SubtitleEntry(
-                index=srt_idx,
-                start_time=entry['start_time'],
-                end_time=entry['end_time'],
-                text=entry['text']
-            )
-            f.write(subtitle_entry.to_srt())
-            f.write('\n')
-    
+    # Stream entries in subtitle order as their OCR results arrive instead
+    # of accumulating them all in memory first. Writes go to a sibling temp
+    # file that replaces output_path only on success, so a failed or
+    # crashed conversion never clobbers an existing SRT
+    written = 0
+    tmp_path = output_path + '.tmp'
+    try:
+        # Binary mode skips the TextIOWrapper layer; each entry is formatted
+        # and UTF-8 encoded exactly once
+        with open(tmp_path, 'wb') as f:
+
+            def _write_entry(text: str, start_time: TimeCode, end_time: TimeCode) -> None:
+                nonlocal written
+                written += 1
+                f.write(f"{written}\n"
+                        f"{start_time.to_srt_format()} --> {end_time.to_srt_format()}\n"
+                        f"{text}\n\n".encode('utf-8'))
+
+            remaining = pending
+            if not debug_mode and len(pending) > 1:
+                # Preferred path: persistent tesserocr worker pool, then a single
+                # batched Tesseract invocation; both amortize model load across
+                # many subtitles. Batches run over a bounded window so only one
+                # window of preprocessed frames is resident at a time; on failure
+                # the per-image fallback below picks up the unprocessed tail.
+                window_size = max(256, 32 * worker_count)
+                start = 0
+                while start < len(pending):
+                    window = pending[start:start + window_size]
+                    _print_progress(f"OCR batch {start + 1}-{start + len(window)} of {len(pending)}...")
+                    processed = [ocr.preprocess_image(img) for _, _, _, img, _ in window]
+                    texts = _ocr_batch(ocr, processed, language, tessdata_path, worker_count)
+                    if texts is None:
+                        break
+                    for (idx, start_tc, end_tc, img, debug_path), text in zip(window, texts):
+                        if text:
+                            _write_entry(text, start_tc, end_tc)
+                    start += window_size
+                remaining = pending[start:]
+
+            if remaining and (worker_count <= 1 or len(remaining) <= 1):
+                for idx, start_tc, end_tc, img, debug_path in _progress_iter(remaining, len(remaining), "OCR"):
+                    _, text = _ocr_one_sup(idx, ocr.preprocess_image(img), debug_path)
+                    if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
+                        if debug_path:
+                            print(f"[DEBUG] Saved preprocessed image: {debug_path}")
+                        print(f"[DEBUG] OCR result for subtitle {idx}: '{text}'")
+
+                    if text:
+                        _write_entry(text, start_tc, end_tc)
+            elif remaining:
+                # More threads than cores (or frames) only adds contention on a
+                # single-threaded engine
+                effective_workers = max(1, min(worker_count, os.cpu_count() or 1, len(remaining)))
+                print(f"OCR fallback threads: {effective_workers}", flush=True)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=effective_workers) as executor:
+                    future_to_item: Dict[concurrent.futures.Future, Tuple[int, int, TimeCode, TimeCode, Optional[str]]] = {}
+                    # Preprocess on this thread while workers recognize, so the
+                    # Tesseract workers spend their time only on recognition
+                    for pos, (idx, start_tc, end_tc, img, debug_path) in enumerate(remaining):
+                        future = executor.submit(_ocr_one_sup, idx, ocr.preprocess_image(img), debug_path)
+                        future_to_item[future] = (pos, idx, start_tc, end_tc, debug_path)
+
+                    # Results arrive out of order; buffer them in a heap and flush
+                    # the contiguous prefix so the file stays in subtitle order
+                    heap: List[Tuple[int, str, TimeCode, TimeCode]] = []
+                    next_pos = 0
+                    for future in _progress_iter(concurrent.futures.as_completed(future_to_item),
+                                                 len(remaining), "OCR"):
+                        pos, idx, start_tc, end_tc, debug_path = future_to_item[future]
+                        try:
+                            _, text = future.result()
+                        except Exception as e:
+                            print(f"\nERROR: OCR failed for subtitle {idx}: {e}", flush=True)
+                            text = ''
+
+                        if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
+                            if debug_path:
+                                print(f"[DEBUG] Saved preprocessed image: {debug_path}")
+                            print(f"[DEBUG] OCR result for subtitle {idx}: '{text}'")
+
+                        heapq.heappush(heap, (pos, text, start_tc, end_tc))
+                        while heap and heap[0][0] == next_pos:
+                            _, text, start_tc, end_tc = heapq.heappop(heap)
+                            if text:
+                                _write_entry(text, start_tc, end_tc)
+                            next_pos += 1
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if debug_io is not None:
+        # Make sure all debug images are on disk before reporting success
+        debug_io.shutdown(wait=True)
+
+    os.replace(tmp_path, output_path)
+    print(f"\nProcessed {written} subtitles with text")
     print(f"Saved SRT to: {output_path}")
     return True
 
@@ -807,91 +1124,154 @@ def convert_sub_to_srt(sub_path: str, output_path: str, language: str = 'eng',
     worker_count = _get_ocr_worker_count()
     print(f"OCR workers: {worker_count}")
 
-    def _ocr_one_vobsub(i: int, img: Image.Image, debug_path: Optional[str]) -> Tuple[int, str]:
-        ocr = TesseractOCR(tesseract_path, tessdata_path)
-        text = ocr.ocr_image(img, language, debug_save_path=debug_path)
+    # Shared instance, same reasoning as in convert_sup_to_srt
+    ocr = TesseractOCR(tesseract_path, tessdata_path)
+
+    # Same frame-level cache as the SUP converter's fallback
+    ocr_cache: Dict[bytes, str] = {}
+    ocr_cache_lock = threading.Lock()
+
+    def _ocr_one_vobsub(i: int, img_processed: Image.Image, debug_path: Optional[str]) -> Tuple[int, str]:
+        if debug_path is not None:
+            return i, ocr.ocr_preprocessed(img_processed, language, debug_save_path=debug_path)
+        key = _frame_key(img_processed)
+        with ocr_cache_lock:
+            text = ocr_cache.get(key)
+        if text is None:
+            text = ocr.ocr_preprocessed(img_processed, language)
+            with ocr_cache_lock:
+                ocr_cache[key] = text
         return i, text
 
-    pending_vobsub: List[Tuple[int, object, Image.Image, Optional[str]]] = []
-    for idx, sub in enumerate(subtitles, 1):
-        if idx == 1 or idx % 25 == 0:
-            _print_progress(f"Collecting subtitle images {idx}/{len(subtitles)}...")
+    # Background writer for debug PNGs, same as the SUP converter
+    debug_io = concurrent.futures.ThreadPoolExecutor(max_workers=1) if debug_mode else None
+
+    # TimeCodes are resolved at collection time so pending_vobsub holds no
+    # references to the parsed sub objects and their SPU buffers
+    pending_vobsub: List[Tuple[int, TimeCode, TimeCode, Image.Image, Optional[str]]] = []
+    for idx, sub in _progress_iter(enumerate(subtitles, 1), len(subtitles),
+                                   "Collecting subtitle images"):
         img = sub.image
         if not img:
             continue
 
+        # Fully transparent filler frames cannot contain text; dropping them
+        # here mirrors the SUP decoder returning None for blank frames and
+        # saves their preprocessing work
+        if img.mode == 'RGBA' and img.getchannel('A').getbbox() is None:
+            continue
+
         debug_path = None
         if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
             original_debug_path = f"debug_sub{idx}_original.png"
-            img.save(original_debug_path)
-            print(f"\n[DEBUG] Saved original image: {original_debug_path}")
+            debug_io.submit(img.copy().save, original_debug_path)
+            print(f"\n[DEBUG] Saving original image: {original_debug_path}")
             debug_path = f"debug_sub{idx}_preprocessed.png"
 
-        pending_vobsub.append((idx, sub, img, debug_path))
-
-    srt_entries = []
-    if worker_count <= 1 or len(pending_vobsub) <= 1:
-        for idx, sub, img, debug_path in pending_vobsub:
-            _print_progress(f"OCR subtitle {idx}/{len(pending_vobsub)}...")
-            _, text = _ocr_one_vobsub(idx, img, debug_path)
-            if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
-                if debug_path:
-                    print(f"[DEBUG] Saved preprocessed image: {debug_path}")
-                print(f"[DEBUG] OCR result for subtitle {idx}: '{text}'")
-
-            if text:
-                start_time = TimeCode.from_milliseconds(sub.start_ms)
-                end_time = TimeCode.from_milliseconds(sub.end_ms)
-                srt_entries.append({'start_time': start_time, 'end_time': end_time, 'text': text, 'original_index': idx})
-    else:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=worker_count) as executor:
-            future_to_item_vobsub: Dict[concurrent.futures.Future, Tuple[int, object, Optional[str]]] = {}
-            for idx, sub, img, debug_path in pending_vobsub:
-                future = executor.submit(_ocr_one_vobsub, idx, img, debug_path)
-                future_to_item_vobsub[future] = (idx, sub, debug_path)
-
-            done_count = 0
-            for future in concurrent.futures.as_completed(future_to_item_vobsub):
-                idx, sub, debug_path = future_to_item_vobsub[future]
-                done_count += 1
-                _print_progress(f"OCR subtitle {done_count}/{len(pending_vobsub)}...")
-                try:
-                    _, text = future.result()
-                except Exception as e:
-                    print(f"\nERROR: OCR failed for subtitle {idx}: {e}", flush=True)
-                    continue
-
-                if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
-                    if debug_path:
-                        print(f"[DEBUG] Saved preprocessed image: {debug_path}")
-                    print(f"[DEBUG] OCR result for subtitle {idx}: '{text}'")
-
-                if text:
-                    start_time = TimeCode.from_milliseconds(sub.start_ms)
-                    end_time = TimeCode.from_milliseconds(sub.end_ms)
-                    srt_entries.append({'start_time': start_time, 'end_time': end_time, 'text': text, 'original_index': idx})
-
-        srt_entries.sort(key=lambda x: x.get('original_index', 0))
-    
-    print(f"\nProcessed {len(srt_entries)} subtitles with text")
-    
-    if not srt_entries:
+        pending_vobsub.append((idx, TimeCode.from_milliseconds(sub.start_ms),
+                               TimeCode.from_milliseconds(sub.end_ms), img, debug_path))
+
+    del subtitles
+
+    # Stream entries to the SRT file in subtitle order, same as the SUP
+    # converter: writes go to a sibling temp file that replaces output_path
+    # only when the conversion produced text, so a failed or empty run
+    # never clobbers an existing SRT
+    written = 0
+    tmp_path = output_path + '.tmp'
+    try:
+        # Binary mode skips the TextIOWrapper layer; each entry is formatted
+        # and UTF-8 encoded exactly once
+        with open(tmp_path, 'wb') as f:
+
+            def _write_entry(text: str, start_time: TimeCode, end_time: TimeCode) -> None:
+                nonlocal written
+                written += 1
+                f.write(f"{written}\n"
+                        f"{start_time.to_srt_format()} --> {end_time.to_srt_format()}\n"
+                        f"{text}\n\n".encode('utf-8'))
+
+            remaining = pending_vobsub
+            if not debug_mode and len(pending_vobsub) > 1:
+                # Same bounded-window batching as the SUP converter; per-image
+                # OCR below picks up the unprocessed tail on failure
+                window_size = max(256, 32 * worker_count)
+                start = 0
+                while start < len(pending_vobsub):
+                    window = pending_vobsub[start:start + window_size]
+                    _print_progress(f"OCR batch {start + 1}-{start + len(window)} of {len(pending_vobsub)}...")
+                    processed = [ocr.preprocess_image(img) for _, _, _, img, _ in window]
+                    texts = _ocr_batch(ocr, processed, language, tessdata_path, worker_count)
+                    if texts is None:
+                        break
+                    for (idx, start_tc, end_tc, img, debug_path), text in zip(window, texts):
+                        if text:
+                            _write_entry(text, start_tc, end_tc)
+                    start += window_size
+                remaining = pending_vobsub[start:]
+
+            if remaining and (worker_count <= 1 or len(remaining) <= 1):
+                for idx, start_tc, end_tc, img, debug_path in _progress_iter(remaining, len(remaining), "OCR"):
+                    _, text = _ocr_one_vobsub(idx, ocr.preprocess_image(img), debug_path)
+                    if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
+                        if debug_path:
+                            print(f"[DEBUG] Saved preprocessed image: {debug_path}")
+                        print(f"[DEBUG] OCR result for subtitle {idx}: '{text}'")
+
+                    if text:
+                        _write_entry(text, start_tc, end_tc)
+            elif remaining:
+                # Same worker cap as the SUP converter
+                effective_workers = max(1, min(worker_count, os.cpu_count() or 1, len(remaining)))
+                print(f"OCR fallback threads: {effective_workers}", flush=True)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=effective_workers) as executor:
+                    future_to_item_vobsub: Dict[concurrent.futures.Future, Tuple[int, int, TimeCode, TimeCode, Optional[str]]] = {}
+                    # Preprocess on this thread while workers recognize
+                    for pos, (idx, start_tc, end_tc, img, debug_path) in enumerate(remaining):
+                        future = executor.submit(_ocr_one_vobsub, idx, ocr.preprocess_image(img), debug_path)
+                        future_to_item_vobsub[future] = (pos, idx, start_tc, end_tc, debug_path)
+
+                    # Heap-ordered flush, same as the SUP converter
+                    heap: List[Tuple[int, str, TimeCode, TimeCode]] = []
+                    next_pos = 0
+                    for future in _progress_iter(concurrent.futures.as_completed(future_to_item_vobsub),
+                                                 len(remaining), "OCR"):
+                        pos, idx, start_tc, end_tc, debug_path = future_to_item_vobsub[future]
+                        try:
+                            _, text = future.result()
+                        except Exception as e:
+                            print(f"\nERROR: OCR failed for subtitle {idx}: {e}", flush=True)
+                            text = ''
+
+                        if debug_mode and (debug_subtitle_index is None or idx == debug_subtitle_index):
+                            if debug_path:
+                                print(f"[DEBUG] Saved preprocessed image: {debug_path}")
+                            print(f"[DEBUG] OCR result for subtitle {idx}: '{text}'")
+
+                        heapq.heappush(heap, (pos, text, start_tc, end_tc))
+                        while heap and heap[0][0] == next_pos:
+                            _, text, start_tc, end_tc = heapq.heappop(heap)
+                            if text:
+                                _write_entry(text, start_tc, end_tc)
+                            next_pos += 1
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if debug_io is not None:
+        debug_io.shutdown(wait=True)
+
+    print(f"\nProcessed {written} subtitles with text")
+
+    if not written:
+        os.remove(tmp_path)
         print("ERROR: No text extracted from subtitles")
         return False
-    
-    # Write SRT file with sequential numbering
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for srt_idx, entry in enumerate(srt_entries, 1):
-            # Create SubtitleEntry and write to file
-            subtitle_entry = SubtitleEntry(
-                index=srt_idx,
-                start_time=entry['start_time'],
-                end_time=entry['end_time'],
-                text=entry['text']
-            )
-            f.write(subtitle_entry.to_srt())
-            f.write('\n')
-    
+
+    os.replace(tmp_path, output_path)
     print(f"Saved SRT to: {output_path}")
     return True
 
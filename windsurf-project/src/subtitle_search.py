@@ -5,9 +5,17 @@ Searches for subtitles using OpenSubtitles.com and Addic7ed providers
 Based on subliminal library
 """
 
+import concurrent.futures
 import logging
 import os
+import re
 import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from babelfish import Language
@@ -19,32 +27,185 @@ from ass_cleaner import clean_ass_file
 
 logger = logging.getLogger(__name__)
 
+_NORM_RE = re.compile(r'[^a-z0-9]+')
+_ASS_TIME_RE = re.compile(r'(\d+):(\d+):(\d+)\.(\d+)')
+
+
+@lru_cache(maxsize=4096)
+def _norm(s: str) -> str:
+    """Lowercase and strip non-alphanumerics for release-name matching."""
+    return _NORM_RE.sub('', (s or '').lower())
+
+
+@lru_cache(maxsize=None)
+def _parse_lang(code: str) -> Optional[Language]:
+    """Parse a language code ('en', 'eng', 'en-US') into a Language, or None.
+
+    Dispatches on shape instead of trying each babelfish constructor in
+    turn, and caches results so repeated searches skip re-parsing.
+    """
+    try:
+        if '-' in code:
+            return Language.fromietf(code)
+        if len(code) == 2:
+            return Language.fromalpha2(code)
+        if len(code) == 3:
+            return Language.fromalpha3(code)
+        return Language.fromietf(code)
+    except Exception:
+        # babelfish raises its own LanguageError hierarchy, not ValueError
+        return None
+
+
+@dataclass(slots=True)
+class SubtitleResult:
+    """One search hit; slotted rows are several times smaller than the dicts
+    they replace and keep attribute access at C level."""
+    id: Optional[str] = None
+    provider: str = ''
+    language: str = ''
+    hearing_impaired: bool = False
+    release_info: Optional[str] = None
+    page_link: Optional[str] = None
+    score: float = 0.0
+    matches: List[str] = field(default_factory=list)
+    subtitle_object: object = None
+    download_link: Optional[str] = None
+    subdl_item: Optional[Dict] = None
+
+    def as_dict(self) -> Dict:
+        """Dict view for JSON serialization and legacy callers."""
+        return {
+            'id': self.id,
+            'provider': self.provider,
+            'language': self.language,
+            'hearing_impaired': self.hearing_impaired,
+            'release_info': self.release_info,
+            'page_link': self.page_link,
+            'score': self.score,
+            'matches': self.matches,
+            'subtitle_object': self.subtitle_object,
+            'download_link': self.download_link,
+            'subdl_item': self.subdl_item,
+        }
+
+
+def _dir_names(output_dir: str) -> set:
+    """Snapshot the directory's entry names with one scandir pass."""
+    try:
+        return {entry.name for entry in os.scandir(output_dir)}
+    except OSError:
+        return set()
+
+
+def _write_unique(output_dir: str, stem: str, ext: str, content: bytes,
+                  existing: Optional[set] = None) -> str:
+    """Write content under a collision-free name, claiming it atomically.
+
+    Tries "<stem>.<ext>", then "<stem>.<index>.<ext>". A directory
+    snapshot skips over names that already exist, so finding a free slot
+    costs one directory scan instead of one failed syscall per collision
+    (which matters on network shares). os.open with O_CREAT | O_EXCL then
+    creates-or-fails in a single syscall, so parallel downloads cannot
+    race between the snapshot and the open.
+
+    Callers writing several files to the same directory can pass a
+    shared `existing` set from _dir_names(); claimed names are added to
+    it, so one snapshot serves all writes.
+    """
+    if existing is None:
+        existing = _dir_names(output_dir)
+    index = 0
+    while True:
+        name = f"{stem}.{ext}" if index == 0 else f"{stem}.{index}.{ext}"
+        if name in existing:
+            index += 1
+            continue
+        path = os.path.join(output_dir, name)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            existing.add(name)
+            index += 1
+            continue
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        existing.add(name)
+        return path
+
+
+_FORMAT_SNIFF_BYTES = 2048
+
+
+# Longest a download is allowed to sit waiting for a rate-limit slot.
+# Waits beyond this (e.g. an exhausted daily budget) fail the download
+# instead of parking a worker thread for hours.
+_RATE_LIMIT_MAX_WAIT = 60.0
+
+
+class _RateLimiter:
+    """Sliding-window rate limiter: at most `limit` acquisitions per
+    `period` seconds.
+
+    Shared across threads so concurrent downloads stay under provider
+    request caps instead of tripping HTML error responses.
+    """
+
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        self._lock = threading.Lock()
+        self._stamps = deque()
+
+    def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """Take a slot, blocking for at most max_wait seconds.
+
+        Returns True once a slot is taken. Returns False immediately when
+        the earliest slot would free up after the deadline, so callers
+        never sleep out a long budget window (e.g. a daily cap) just to
+        fail anyway.
+        """
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._stamps and now - self._stamps[0] >= self.period:
+                    self._stamps.popleft()
+                if len(self._stamps) < self.limit:
+                    self._stamps.append(now)
+                    return True
+                wait = self.period - (now - self._stamps[0])
+                if deadline is not None and now + wait > deadline:
+                    return False
+            time.sleep(max(wait, 0.01))
+
 
 def detect_subtitle_format(content: bytes) -> str:
     """
     Detect subtitle format from content
-    
+
+    Only the leading bytes are decoded: the [Script Info] header and its
+    ScriptType line sit at the top of ASS/SSA files, so there is no need
+    to decode and lowercase a whole subtitle just to sniff its format.
+
     Args:
         content: Subtitle file content as bytes
-        
+
     Returns:
         File extension: 'srt', 'ass', or 'ssa'
     """
     try:
-        # Try to decode as text
-        text = content.decode('utf-8', errors='ignore')
-        text_lower = text.lower()
-        
-        # Check for ASS format (Advanced SubStation Alpha)
-        if '[script info]' in text_lower and 'scripttype:' in text_lower:
-            if 'scripttype: v4.00+' in text_lower:
+        head = content[:_FORMAT_SNIFF_BYTES].decode('utf-8', errors='ignore').lower()
+
+        # Check for ASS/SSA (SubStation Alpha) header
+        if '[script info]' in head:
+            if 'scripttype:' not in head and len(content) > _FORMAT_SNIFF_BYTES:
+                # Unusually long header; fall back to the full content
+                head = content.decode('utf-8', errors='ignore').lower()
+            if 'scripttype: v4.00+' in head:
                 return 'ass'
             return 'ssa'
-        
-        # Check for SSA format (SubStation Alpha)
-        if '[script info]' in text_lower:
-            return 'ssa'
-        
+
         # Default to SRT format
         return 'srt'
     except Exception as e:
@@ -90,32 +251,41 @@ def convert_ass_to_srt(content: bytes) -> bytes:
 def convert_ass_time_to_srt(ass_time: str) -> str:
     """
     Convert ASS time format (H:MM:SS.CC) to SRT format (HH:MM:SS,mmm)
-    
+
     Args:
         ass_time: Time in ASS format (e.g., "0:01:23.45")
-        
+
     Returns:
         Time in SRT format (e.g., "00:01:23,450")
     """
-    import re
-    
+    # Fast path: canonical H:MM:SS.CC needs only three splits and four
+    # int() calls, no regex engine. Anything irregular falls through to
+    # the compiled pattern below.
     try:
-        # Parse ASS time: H:MM:SS.CC
-        match = re.match(r'(\d+):(\d+):(\d+)\.(\d+)', ass_time)
+        hours, rest = ass_time.split(':', 1)
+        minutes, rest = rest.split(':', 1)
+        seconds, centiseconds = rest.split('.', 1)
+        return (f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d},"
+                f"{int(centiseconds) * 10:03d}")
+    except (AttributeError, ValueError):
+        pass
+
+    try:
+        match = _ASS_TIME_RE.match(ass_time)
         if not match:
             return None
-        
+
         hours = int(match.group(1))
         minutes = int(match.group(2))
         seconds = int(match.group(3))
         centiseconds = int(match.group(4))
-        
+
         # Convert centiseconds to milliseconds
         milliseconds = centiseconds * 10
-        
+
         # Format as SRT: HH:MM:SS,mmm
         return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
-        
+
     except Exception as e:
         logger.warning(f'Error converting ASS time to SRT: {e}')
         return None
@@ -123,7 +293,15 @@ def convert_ass_time_to_srt(ass_time: str) -> str:
 
 class SubtitleSearcher:
     """Search and download subtitles using OpenSubtitles.com, Addic7ed, and SubDL"""
-    
+
+    # Shared per-provider request caps (OpenSubtitles: 40 requests per 10s;
+    # Addic7ed: 24 downloads per day). Class-level so every searcher
+    # instance in the process draws from the same budget.
+    _rate_limiters = {
+        'opensubtitles': _RateLimiter(40, 10.0),
+        'addic7ed': _RateLimiter(24, 86400.0),
+    }
+
     def __init__(self, opensubtitles_username: str = None, opensubtitles_password: str = None,
                  addic7ed_username: str = None, addic7ed_password: str = None,
                  subdl_api_key: str = None):
@@ -141,6 +319,27 @@ class SubtitleSearcher:
         self.addic7ed_username = addic7ed_username
         self.addic7ed_password = addic7ed_password
         self.subdl_api_key = subdl_api_key
+        # scan_video results keyed by (abspath, mtime_ns, size); scanning
+        # opens the container and hashes the file, so the usual search-then-
+        # download flow should only pay for it once per video
+        self._video_cache: Dict[Tuple[str, int, int], object] = {}
+
+    def _get_video(self, video_path: str):
+        """Scan a video with subliminal, reusing a cached result when the
+        file is unchanged."""
+        import subliminal
+
+        st = os.stat(video_path)
+        key = (os.path.abspath(video_path), st.st_mtime_ns, st.st_size)
+        video = self._video_cache.get(key)
+        if video is None:
+            video = subliminal.scan_video(video_path)
+            self._video_cache[key] = video
+        return video
+
+    def invalidate_cache(self) -> None:
+        """Drop cached scan_video results."""
+        self._video_cache.clear()
 
     def _to_subdl_languages(self, languages: List[str]) -> str:
         """Convert user language codes to SubDL API language codes (comma-separated)."""
@@ -188,10 +387,9 @@ class SubtitleSearcher:
             return 'tv'
         return 'movie'
 
-    def _search_subdl(self, video, video_path: str, languages: List[str]) -> List[Dict]:
+    def _search_subdl(self, video, video_path: str, languages: List[str]) -> List[SubtitleResult]:
         import requests
-        from difflib import SequenceMatcher
-        import re
+        from rapidfuzz import fuzz
         from urllib.parse import urlencode
 
         if not self.subdl_api_key:
@@ -266,39 +464,40 @@ class SubtitleSearcher:
         subs = payload.get('subtitles') or []
         logger.info('SubDL search returned %s subtitle(s)', len(subs))
 
-        def _norm(s: str) -> str:
-            return re.sub(r'[^a-z0-9]+', '', (s or '').lower())
-
         stem = os.path.splitext(base_name)[0]
         stem_n = _norm(stem)
 
         results = []
         for item in subs:
             rel = str(item.get('release_name') or item.get('name') or '')
-            score = SequenceMatcher(None, stem_n, _norm(rel)).ratio() if rel else 0.0
+            rel_n = _norm(rel)
+            if not rel_n or not stem_n:
+                score = 0.0
+            elif rel_n == stem_n:
+                score = 1.0
+            elif rel_n.startswith(stem_n) or stem_n.startswith(rel_n):
+                score = 0.95
+            else:
+                score = fuzz.ratio(stem_n, rel_n) / 100.0
             dl = item.get('download_link')
             if not dl and item.get('url'):
                 dl = 'https://dl.subdl.com' + str(item.get('url'))
-            result = {
-                'id': dl or item.get('url') or item.get('name'),
-                'provider': 'subdl',
-                'language': str(item.get('lang') or ''),
-                'hearing_impaired': bool(item.get('hi') or False),
-                'release_info': rel or None,
-                'page_link': None,
-                'score': float(score),
-                'matches': [],
-                'download_link': dl,
-                'subdl_item': item,
-                'subtitle_object': None,
-            }
-            results.append(result)
-
-        results.sort(key=lambda x: x.get('score', 0.0), reverse=True)
+            results.append(SubtitleResult(
+                id=dl or item.get('url') or item.get('name'),
+                provider='subdl',
+                language=str(item.get('lang') or ''),
+                hearing_impaired=bool(item.get('hi') or False),
+                release_info=rel or None,
+                score=float(score),
+                download_link=dl,
+                subdl_item=item,
+            ))
+
+        results.sort(key=attrgetter('score'), reverse=True)
         return results
         
     def search_subtitles(self, video_path: str, languages: List[str], 
-                        providers: List[str] = None) -> List[Dict]:
+                        providers: List[str] = None) -> List[SubtitleResult]:
         """
         Search for subtitles for a video file
         
@@ -308,7 +507,7 @@ class SubtitleSearcher:
             providers: List of providers to use (default: ['opensubtitles', 'addic7ed'])
             
         Returns:
-            List of subtitle dictionaries with metadata
+            List of SubtitleResult rows with metadata
         """
         try:
             import subliminal
@@ -337,19 +536,10 @@ class SubtitleSearcher:
         for code in languages:
             if not code:
                 continue
-            code = str(code).strip()
-            try:
-                # Try alpha2 (e.g. 'en', 'de')
-                if len(code) == 2:
-                    lang_obj = Language.fromalpha2(code)
-                # Try alpha3 (e.g. 'eng')
-                elif len(code) == 3:
-                    lang_obj = Language.fromalpha3(code)
-                else:
-                    # Fall back to IETF (e.g. 'en-US')
-                    lang_obj = Language.fromietf(code)
+            lang_obj = _parse_lang(str(code).strip())
+            if lang_obj is not None:
                 language_set.add(lang_obj)
-            except ValueError:
+            else:
                 logger.warning(f"Invalid language code for subtitle search, skipping: {code}")
 
         if not language_set:
@@ -357,7 +547,7 @@ class SubtitleSearcher:
         
         # Scan video file to extract metadata
         logger.info(f'Scanning video file: {video_path}')
-        video = subliminal.scan_video(video_path)
+        video = self._get_video(video_path)
         
         # Build provider configs
         provider_configs = {}
@@ -372,34 +562,53 @@ class SubtitleSearcher:
                 'password': self.addic7ed_password
             }
         
-        all_results: List[Dict] = []
+        all_results: List[SubtitleResult] = []
 
         # Search via subliminal providers
         subliminal_providers = [p for p in providers if p in ['opensubtitles', 'addic7ed']]
         if subliminal_providers:
             logger.info(f'Searching subtitles with providers: {subliminal_providers}')
-            subtitles_dict = subliminal.list_subtitles({video}, language_set,
-                                                       providers=subliminal_providers,
-                                                       provider_configs=provider_configs)
-            subtitles = subtitles_dict.get(video, [])
+            if len(subliminal_providers) == 1:
+                subtitles_dict = subliminal.list_subtitles({video}, language_set,
+                                                           providers=subliminal_providers,
+                                                           provider_configs=provider_configs)
+                subtitles = subtitles_dict.get(video, [])
+            else:
+                # Provider queries are network-bound, so fan them out and let
+                # wall time track the slowest provider instead of the sum. A
+                # provider that errors out only loses its own results.
+                subtitles = []
+                with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=len(subliminal_providers)) as executor:
+                    futures = {
+                        executor.submit(subliminal.list_subtitles, {video}, language_set,
+                                        providers=[provider],
+                                        provider_configs=provider_configs): provider
+                        for provider in subliminal_providers
+                    }
+                    for future in concurrent.futures.as_completed(futures):
+                        provider = futures[future]
+                        try:
+                            subtitles.extend(future.result().get(video, []))
+                        except Exception as e:
+                            logger.exception(f'Provider {provider} search failed: {e}')
             logger.info(f'Found {len(subtitles)} subliminal subtitle(s)')
 
             for subtitle in subtitles:
                 matches = subtitle.get_matches(video)
                 score = subliminal.compute_score(subtitle, video)
 
-                result = {
-                    'id': str(subtitle.id) if hasattr(subtitle, 'id') else None,
-                    'provider': subtitle.provider_name,
-                    'language': str(subtitle.language),
-                    'hearing_impaired': subtitle.hearing_impaired if hasattr(subtitle, 'hearing_impaired') else False,
-                    'release_info': subtitle.release_info if hasattr(subtitle, 'release_info') else None,
-                    'page_link': subtitle.page_link if hasattr(subtitle, 'page_link') else None,
-                    'score': score,
-                    'matches': list(matches),
-                    'subtitle_object': subtitle
-                }
-                all_results.append(result)
+                all_results.append(SubtitleResult(
+                    id=str(subtitle.id) if hasattr(subtitle, 'id') else None,
+                    provider=subtitle.provider_name,
+                    language=str(subtitle.language),
+                    hearing_impaired=subtitle.hearing_impaired if hasattr(subtitle, 'hearing_impaired') else False,
+                    release_info=subtitle.release_info if hasattr(subtitle, 'release_info') else None,
+                    page_link=subtitle.page_link if hasattr(subtitle, 'page_link') else None,
+                    score=score,
+                    matches=list(matches),
+                    subtitle_object=subtitle,
+                ))
 
         # Search via SubDL API
         if 'subdl' in providers:
@@ -409,18 +618,19 @@ class SubtitleSearcher:
             except Exception as e:
                 logger.exception(f'Failed to search SubDL: {e}')
         
-        all_results.sort(key=lambda x: x.get('score', 0.0), reverse=True)
+        all_results.sort(key=attrgetter('score'), reverse=True)
         return all_results
     
-    def download_subtitle(self, subtitle_dict: Dict, video_path: str, output_dir: str = None) -> Optional[str]:
+    def download_subtitle(self, subtitle_dict: 'SubtitleResult', video_path: str, output_dir: str = None) -> Optional[str]:
         """
         Download a specific subtitle
-        
+
         Args:
-            subtitle_dict: Subtitle dictionary from search_subtitles()
+            subtitle_dict: SubtitleResult from search_subtitles() (a plain
+                dict with the same keys is also accepted)
             video_path: Original video file path
             output_dir: Directory to save subtitle (default: same as video)
-            
+
         Returns:
             Path to downloaded subtitle file, or None if failed
         """
@@ -431,16 +641,19 @@ class SubtitleSearcher:
                 "Subtitle download requires the 'subliminal' package. Install it to use this feature."
             ) from e
 
-        provider_hint = (subtitle_dict.get('provider') or '').lower()
+        if isinstance(subtitle_dict, dict):
+            subtitle_dict = SubtitleResult(**subtitle_dict)
+
+        provider_hint = (subtitle_dict.provider or '').lower()
         if provider_hint == 'subdl':
             return self._download_subdl_subtitle(subtitle_dict, video_path, output_dir=output_dir)
 
-        subtitle = subtitle_dict.get('subtitle_object')
+        subtitle = subtitle_dict.subtitle_object
         if not subtitle:
             logger.error('No subtitle object found in dictionary')
             return None
         
-        video = subliminal.scan_video(video_path)
+        video = self._get_video(video_path)
         provider_name = subtitle.provider_name
         
         # Build provider config
@@ -457,8 +670,12 @@ class SubtitleSearcher:
             }
         
         try:
-            # Download subtitle
+            # Download subtitle, staying under the provider's request cap
             logger.info(f'Downloading subtitle from {provider_name}')
+            limiter = self._rate_limiters.get(provider_name)
+            if limiter is not None and not limiter.acquire(max_wait=_RATE_LIMIT_MAX_WAIT):
+                logger.error(f'{provider_name} request budget exhausted; skipping download')
+                return None
             subliminal.download_subtitles([subtitle], providers=[provider_name],
                                          provider_configs=provider_configs)
             
@@ -470,28 +687,16 @@ class SubtitleSearcher:
             detected_format = detect_subtitle_format(subtitle.content)
             logger.info(f'Detected subtitle format: {detected_format}')
             
-            # Generate base output filename with correct extension
+            # Save subtitle content in original format under a collision-free
+            # name claimed atomically (no exists-probe/open race); one
+            # directory snapshot covers the SRT conversion write too
             video_basename = os.path.splitext(os.path.basename(video_path))[0]
             lang = subtitle.language
-            base_filename = f"{video_basename}.{lang}.{detected_format}"
-            output_path = os.path.join(output_dir, base_filename)
-
-            # Avoid overwriting existing files: append numeric suffix if needed
-            if os.path.exists(output_path):
-                index = 1
-                while True:
-                    alt_filename = f"{video_basename}.{lang}.{index}.{detected_format}"
-                    alt_path = os.path.join(output_dir, alt_filename)
-                    if not os.path.exists(alt_path):
-                        output_path = alt_path
-                        break
-                    index += 1
-
-            # Save subtitle content in original format
-            logger.info(f'Saving subtitle to: {output_path}')
-            with open(output_path, 'wb') as f:
-                f.write(subtitle.content)
-            
+            existing = _dir_names(output_dir)
+            output_path = _write_unique(output_dir, f"{video_basename}.{lang}",
+                                        detected_format, subtitle.content,
+                                        existing=existing)
+
             logger.info(f'Successfully downloaded subtitle: {output_path}')
             
             # If format is ASS or SSA, convert to SRT automatically
@@ -507,26 +712,12 @@ class SubtitleSearcher:
                             logger.exception(f'Failed to clean ASS before conversion; converting original content: {e}')
 
                     srt_content = convert_ass_to_srt(ass_content)
-                    
-                    # Generate SRT filename
-                    srt_base_filename = f"{video_basename}.{lang}.srt"
-                    srt_output_path = os.path.join(output_dir, srt_base_filename)
-                    
-                    # Avoid overwriting existing SRT files
-                    if os.path.exists(srt_output_path):
-                        index = 1
-                        while True:
-                            alt_srt_filename = f"{video_basename}.{lang}.{index}.srt"
-                            alt_srt_path = os.path.join(output_dir, alt_srt_filename)
-                            if not os.path.exists(alt_srt_path):
-                                srt_output_path = alt_srt_path
-                                break
-                            index += 1
-                    
-                    # Save converted SRT file
-                    with open(srt_output_path, 'wb') as f:
-                        f.write(srt_content)
-                    
+
+                    # Save converted SRT under its own collision-free name
+                    srt_output_path = _write_unique(output_dir, f"{video_basename}.{lang}",
+                                                    'srt', srt_content,
+                                                    existing=existing)
+
                     logger.info(f'Successfully converted and saved SRT file: {srt_output_path}')
                     
                 except Exception as e:
@@ -538,12 +729,51 @@ class SubtitleSearcher:
             logger.exception(f'Failed to download subtitle: {e}')
             return None
 
-    def _download_subdl_subtitle(self, subtitle_dict: Dict, video_path: str, output_dir: str = None) -> Optional[str]:
+    def download_subtitles_batch(self, subtitle_dicts: List['SubtitleResult'], video_path: str,
+                                 output_dir: str = None, max_workers: int = 5) -> List[Optional[str]]:
+        """
+        Download several subtitles concurrently (e.g. best candidate per language)
+
+        Provider request caps are enforced by the shared rate limiters, so
+        raising concurrency cannot trip OpenSubtitles/Addic7ed limits.
+
+        Args:
+            subtitle_dicts: SubtitleResult rows from search_subtitles()
+            video_path: Original video file path
+            output_dir: Directory to save subtitles (default: same as video)
+            max_workers: Upper bound on concurrent downloads
+
+        Returns:
+            Paths in the same order as subtitle_dicts, None where a download failed
+        """
+        if not subtitle_dicts:
+            return []
+
+        # Warm the scan_video cache before fanning out so worker threads
+        # don't race to hash the same file
+        self._get_video(video_path)
+
+        results: List[Optional[str]] = [None] * len(subtitle_dicts)
+        workers = max(1, min(max_workers, len(subtitle_dicts)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.download_subtitle, subtitle_dict, video_path, output_dir): i
+                for i, subtitle_dict in enumerate(subtitle_dicts)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.exception(f'Batch subtitle download failed: {e}')
+        return results
+
+    def _download_subdl_subtitle(self, subtitle_dict: 'SubtitleResult', video_path: str, output_dir: str = None) -> Optional[str]:
         import requests
         import zipfile
         import io
 
-        dl = subtitle_dict.get('download_link')
+        dl = subtitle_dict.download_link
         if not dl:
             logger.error('Missing download_link for SubDL subtitle')
             return None
@@ -578,24 +808,15 @@ class SubtitleSearcher:
         video_basename = os.path.splitext(os.path.basename(video_path))[0]
 
         # Use user configured language list only indirectly; SubDL response language is free-text
-        lang = subtitle_dict.get('language') or 'sub'
+        lang = subtitle_dict.language or 'sub'
         lang_safe = str(lang).strip().replace(' ', '_')
-        base_filename = f"{video_basename}.{lang_safe}.{detected_format}"
-        output_path = os.path.join(output_dir, base_filename)
-
-        if os.path.exists(output_path):
-            index = 1
-            while True:
-                alt_filename = f"{video_basename}.{lang_safe}.{index}.{detected_format}"
-                alt_path = os.path.join(output_dir, alt_filename)
-                if not os.path.exists(alt_path):
-                    output_path = alt_path
-                    break
-                index += 1
-
-        logger.info(f'Saving SubDL subtitle to: {output_path}')
-        with open(output_path, 'wb') as f:
-            f.write(content)
+
+        # Claim a collision-free name atomically instead of probing with exists();
+        # share one directory snapshot with the SRT conversion write below
+        existing = _dir_names(output_dir)
+        output_path = _write_unique(output_dir, f"{video_basename}.{lang_safe}", detected_format, content,
+                                    existing=existing)
+        logger.info(f'Saved SubDL subtitle to: {output_path}')
 
         if detected_format in ['ass', 'ssa']:
             logger.info(f'Converting {detected_format.upper()} to SRT format')
@@ -609,19 +830,8 @@ class SubtitleSearcher:
                         logger.exception(f'Failed to clean ASS before conversion; converting original content: {e}')
 
                 srt_content = convert_ass_to_srt(ass_content)
-                srt_base_filename = f"{video_basename}.{lang_safe}.srt"
-                srt_output_path = os.path.join(output_dir, srt_base_filename)
-                if os.path.exists(srt_output_path):
-                    index = 1
-                    while True:
-                        alt_srt_filename = f"{video_basename}.{lang_safe}.{index}.srt"
-                        alt_srt_path = os.path.join(output_dir, alt_srt_filename)
-                        if not os.path.exists(alt_srt_path):
-                            srt_output_path = alt_srt_path
-                            break
-                        index += 1
-                with open(srt_output_path, 'wb') as f:
-                    f.write(srt_content)
+                srt_output_path = _write_unique(output_dir, f"{video_basename}.{lang_safe}", 'srt', srt_content,
+                                                existing=existing)
                 logger.info(f'Successfully converted and saved SRT file: {srt_output_path}')
             except Exception as e:
                 logger.exception(f'Failed to convert {detected_format.upper()} to SRT: {e}')
@@ -632,7 +842,7 @@ class SubtitleSearcher:
 def search_and_list(video_path: str, languages: List[str], 
                     opensubtitles_username: str = None, opensubtitles_password: str = None,
                     addic7ed_username: str = None, addic7ed_password: str = None,
-                    subdl_api_key: str = None) -> List[Dict]:
+                    subdl_api_key: str = None) -> List[SubtitleResult]:
     """
     Convenience function to search for subtitles
     
@@ -645,7 +855,7 @@ def search_and_list(video_path: str, languages: List[str],
         addic7ed_password: Addic7ed password
         
     Returns:
-        List of subtitle dictionaries
+        List of SubtitleResult rows
     """
     searcher = SubtitleSearcher(
         opensubtitles_username=opensubtitles_username,
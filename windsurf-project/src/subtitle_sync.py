@@ -7,6 +7,7 @@ import re
 import subprocess
 import tempfile
 import time
+from collections import deque
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -410,6 +411,8 @@ def build_anchor_candidates(
 
 
 def _similarity(left: str, right: str) -> float:
+    if rapidfuzz_fuzz is not None:
+        return rapidfuzz_fuzz.ratio(left, right) / 100.0
     from difflib import SequenceMatcher
 
     return SequenceMatcher(None, left, right).ratio()
@@ -427,17 +430,17 @@ def find_anchor_match(
     search_from_end: bool,
     min_similarity: float = 0.5,
 ) -> AnchorMatch:
-    candidate_windows = windows if not search_from_end else list(reversed(windows))
+    # The midpoint cutoff is invariant across candidates; filter the windows
+    # once instead of re-checking it on every candidate x window pair.
     midpoint = len(cues) // 2
+    if not search_from_end:
+        candidate_windows = [w for w in windows if w.start_index <= midpoint]
+    else:
+        candidate_windows = [w for w in reversed(windows) if w.end_index >= midpoint]
     best: Optional[tuple[float, SlidingCueWindow, AnchorCandidate]] = None
 
     for candidate in candidates:
         for window in candidate_windows:
-            if not search_from_end and window.start_index > midpoint:
-                break
-            if search_from_end and window.end_index < midpoint:
-                break
-
             score = _similarity(candidate.normalized_text, window.normalized_text)
             if best is None or score > best[0]:
                 best = (score, window, candidate)
@@ -604,6 +607,21 @@ def select_audio_stream(metadata: VideoMetadata, subtitle_language_alpha3: str)
     raise SubtitleSyncError('No audio streams found in video file')
 
 
+def _run_with_stderr_tail(cmd: List[str], tail_lines: int = 40) -> tuple[int, str]:
+    """Run a command, keeping only the last tail_lines of stderr.
+
+    capture_output=True would hold the full stream in memory for the whole
+    run; for long ffmpeg invocations only the tail is ever used for error
+    reporting, so stream the pipe and retain a bounded window.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    tail: deque = deque(maxlen=tail_lines)
+    for line in proc.stderr:
+        tail.append(line)
+    returncode = proc.wait()
+    return returncode, ''.join(tail).strip()
+
+
 def extract_audio_window(video_path: str, stream_index: int, window: AudioSampleWindow, temp_dir: str) -> str:
     if not shutil.which('ffmpeg'):
         raise SubtitleSyncError('ffmpeg is not installed or not found in PATH')
@@ -621,9 +639,9 @@ def extract_audio_window(video_path: str, stream_index: int, window: AudioSample
         '-c:a', 'pcm_s16le',
         output_path,
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise SubtitleSyncError(f'ffmpeg audio extraction failed: {(result.stderr or result.stdout or "unknown error").strip()}')
+    returncode, stderr_tail = _run_with_stderr_tail(cmd)
+    if returncode != 0:
+        raise SubtitleSyncError(f'ffmpeg audio extraction failed: {stderr_tail or "unknown error"}')
     logger.info(
         'subtitle_sync: extracted %s window audio in %.2fs (stream=%s start=%.3fs duration=%.3fs)',
         window.name,
@@ -8,12 +8,22 @@ import os
 import subprocess
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from azure.ai.translation.text import TextTranslationClient
 from azure.core.credentials import AzureKeyCredential
 
+# Shared keep-alive session so repeated API calls reuse TCP/TLS connections
+# instead of paying a fresh handshake per request. Retries stay disabled here;
+# failover is handled at the job-queue level.
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=0))
+_http_session.mount('https://', _http_adapter)
+_http_session.mount('http://', _http_adapter)
+
 
 def _split_batches(texts: List[str], max_items: int = 50, max_chars: int = 0) -> List[List[str]]:
     max_items = max(1, int(max_items) if max_items is not None else 50)
@@ -133,6 +143,7 @@ def translate_texts_deepl(
     max_chars_per_request: int = 0,
     delay: float = 0.0,
     max_retries: int = 5,
+    session: Optional[requests.Session] = None,
 ) -> List[str]:
     """
     Translate texts using DeepL API.
@@ -154,8 +165,10 @@ def translate_texts_deepl(
         "Content-Type": "application/json",
     }
 
+    http = session or _http_session
+
     def _post(payload_obj: dict) -> dict:
-        resp = requests.post(
+        resp = http.post(
             url,
             headers=headers,
             data=json.dumps(payload_obj, ensure_ascii=False),
@@ -170,10 +183,8 @@ def translate_texts_deepl(
             body_preview = (resp.text or "").strip().replace("\n", " ")[:500]
             raise RuntimeError(f"DeepL returned non-JSON response: {e}. Response: {body_preview}") from e
 
-    translations: list[str] = []
-    batches = _split_batches(cleaned, max_items=batch_size, max_chars=max_chars_per_request)
-    for bi, batch in enumerate(batches):
-        payload_obj = {
+    def _payload(batch: List[str]) -> dict:
+        return {
             "text": batch,
             "target_lang": target_lang.upper(),
             "context": context,
@@ -182,12 +193,26 @@ def translate_texts_deepl(
             "preserve_formatting": False,
         }
 
-        data = _post(payload_obj)
+    def _extract(batch: List[str], data: dict) -> List[str]:
         items = data.get("translations")
         if not isinstance(items, list) or len(items) != len(batch):
             raise ValueError(f"DeepL returned unexpected response shape: {data}")
+        return [str(x.get("text", "")) for x in items]
 
-        translations.extend([str(x.get("text", "")) for x in items])
+    translations: list[str] = []
+    batches = _split_batches(cleaned, max_items=batch_size, max_chars=max_chars_per_request)
+
+    if len(batches) > 1 and not (delay and delay > 0):
+        # No pacing requested: batches are independent, so issue them
+        # concurrently over the pooled session and keep the original order.
+        with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+            responses = list(executor.map(lambda b: _post(_payload(b)), batches))
+        for batch, data in zip(batches, responses):
+            translations.extend(_extract(batch, data))
+        return translations
+
+    for bi, batch in enumerate(batches):
+        translations.extend(_extract(batch, _post(_payload(batch))))
 
         if bi + 1 < len(batches) and delay and delay > 0:
             time.sleep(delay)
@@ -465,7 +490,8 @@ def translate_srt_file(
     deepl_endpoint: str = "https://api-free.deepl.com/v2/translate",
     azure_endpoint: str = "https://api.cognitive.microsofttranslator.com",
     azure_region: str = "germanywestcentral",
-    gemini_model: str = "gemini-2.0-flash"
+    gemini_model: str = "gemini-2.0-flash",
+    session: Optional[requests.Session] = None
 ) -> bool:
     """
     Translate an SRT subtitle file.
@@ -535,6 +561,7 @@ def translate_srt_file(
                     endpoint=deepl_endpoint,
                     delay=delay_seconds,
                     max_chars_per_request=max_chars_per_request,
+                    session=session,
                 )
             elif provider.lower() == "azure":
                 translations = translate_texts_azure(